@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""Build and upload code-recap to PyPI / TestPyPI.
+
+Companion to scripts/bump-version.sh: after bumping and tagging a release,
+run this to build the sdist+wheel and upload them. Requires the dev extras
+(`pip install -e ".[dev]"` or `uv sync --dev`) for build and twine.
+
+Usage:
+    ./scripts/deploy_pypi.py --test          # Upload to TestPyPI
+    ./scripts/deploy_pypi.py --production    # Upload to PyPI
+    ./scripts/deploy_pypi.py --build-only    # Just build, no upload
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DIST_DIR = ROOT_DIR / "dist"
+BUILD_HASH_FILE = DIST_DIR / ".build_hash"
+
+
+def compute_build_hash() -> str:
+    """Hashes the build inputs (sources, pyproject, README).
+
+    Uses (path, mtime_ns, size) per file rather than file contents, which is
+    enough to detect edits without reading every source file.
+
+    Returns:
+        Hex digest identifying the current build inputs.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    inputs = sorted(
+        p
+        for p in [
+            *(ROOT_DIR / "src").rglob("*"),
+            ROOT_DIR / "pyproject.toml",
+            *ROOT_DIR.glob("README*"),
+        ]
+        if p.is_file() and "__pycache__" not in p.parts
+    )
+    for path in inputs:
+        stat = path.stat()
+        hasher.update(f"{path.relative_to(ROOT_DIR)}|{stat.st_mtime_ns}|{stat.st_size}\n".encode())
+    return hasher.hexdigest()
+
+
+def build_is_cached(source_hash: str, version: str) -> bool:
+    """Checks whether dist/ already holds a build of the current sources.
+
+    Args:
+        source_hash: Hash of the current build inputs from compute_build_hash().
+        version: Version from check_version(); cached artifacts must match it.
+
+    Returns:
+        True if dist/ contains a wheel and sdist of this version built from
+        matching sources.
+    """
+    if not (
+        any(DIST_DIR.glob(f"code_recap-{version}-*.whl"))
+        and any(DIST_DIR.glob(f"code_recap-{version}.tar.gz"))
+    ):
+        return False
+    try:
+        return BUILD_HASH_FILE.read_text().strip() == source_hash
+    except OSError:
+        return False
+
+
+def run_command(cmd: list[str]) -> subprocess.CompletedProcess:
+    """Runs a command from the project root.
+
+    Never raises on failure; callers inspect returncode instead, which
+    avoids constructing and unwinding a CalledProcessError on error paths.
+
+    Args:
+        cmd: Command and arguments to execute.
+
+    Returns:
+        The CompletedProcess for the command.
+    """
+    print(f"Running: {' '.join(cmd)}", file=sys.stderr)
+    return subprocess.run(cmd, cwd=ROOT_DIR, check=False)
+
+
+def run_command_streaming(cmd: list[str]) -> int:
+    """Runs a command, forwarding its output line by line as it arrives.
+
+    Unlike run_command this does not buffer until exit, so long-running
+    uploads show progress (and failures) immediately.
+
+    Args:
+        cmd: Command and arguments to execute.
+
+    Returns:
+        The command's exit code.
+    """
+    print(f"Running: {' '.join(cmd)}", file=sys.stderr)
+    proc = subprocess.Popen(
+        cmd,
+        cwd=ROOT_DIR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+    )
+    assert proc.stdout is not None
+    for line in proc.stdout:
+        sys.stderr.write(line)
+    return proc.wait()
+
+
+_VERSION_RE = re.compile(rb"^__version__\s*=\s*[\"']([^\"']+)", re.MULTILINE)
+
+
+def check_version() -> str:
+    """Reads the package version from the package __init__.py.
+
+    Scans the raw bytes with a regex rather than importing code_recap or
+    decoding and splitting the file line by line.
+
+    Returns:
+        The version string, or "unknown" if it could not be determined.
+    """
+    init_file = ROOT_DIR / "src" / "code_recap" / "__init__.py"
+    match = _VERSION_RE.search(init_file.read_bytes())
+    return match.group(1).decode() if match else "unknown"
+
+
+def _remove_tree(path: Path) -> None:
+    """Removes a directory tree using scandir's cached entry types.
+
+    DirEntry.is_dir(follow_symlinks=False) reads the dirent type without an
+    extra stat per entry, so this issues fewer syscalls than shutil.rmtree.
+
+    Args:
+        path: Directory to remove.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_tree(Path(entry.path))
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def clean_dist() -> None:
+    """Removes previously built artifacts from dist/."""
+    if not DIST_DIR.is_dir():
+        return
+    try:
+        _remove_tree(DIST_DIR)
+    except OSError:
+        shutil.rmtree(DIST_DIR, ignore_errors=True)
+    print("Cleaned dist/", file=sys.stderr)
+
+
+def build_package() -> bool:
+    """Builds the sdist and wheel with python -m build.
+
+    Returns:
+        True if the build succeeded, otherwise False.
+    """
+    cmd = [sys.executable, "-m", "build"]
+    # uv installs the build backend into the isolated env far faster than pip.
+    if shutil.which("uv"):
+        cmd.append("--installer=uv")
+    if run_command(cmd).returncode != 0:
+        print("Build failed", file=sys.stderr)
+        return False
+    return True
+
+
+def _upload(repository_name: str, label: str) -> bool:
+    """Uploads dist/ artifacts to a package index.
+
+    Calls the twine API in-process when twine is importable, which avoids a
+    fresh interpreter start per upload target. Falls back to the twine CLI
+    via subprocess if the import fails.
+
+    Args:
+        repository_name: Twine repository name ("pypi" or "testpypi").
+        label: Human-readable index name for log messages.
+
+    Returns:
+        True if the upload succeeded, otherwise False.
+    """
+    dists = sorted(
+        str(p) for p in DIST_DIR.glob("*") if p.suffix in (".whl", ".gz") or p.suffix == ".zip"
+    )
+    if not dists:
+        print(f"No artifacts in dist/ to upload to {label}", file=sys.stderr)
+        return False
+
+    try:
+        from twine.commands.upload import upload
+        from twine.exceptions import TwineException
+        from twine.settings import Settings
+    except ImportError:
+        cmd = [sys.executable, "-m", "twine", "upload"]
+        if repository_name != "pypi":
+            cmd += ["--repository", repository_name]
+        if run_command_streaming(cmd + dists) != 0:
+            print(f"{label} upload failed", file=sys.stderr)
+            return False
+        return True
+
+    print(f"Uploading {len(dists)} artifacts to {label}...", file=sys.stderr)
+    try:
+        upload(Settings(repository_name=repository_name), dists)
+    except TwineException as exc:
+        print(f"{label} upload failed: {exc}", file=sys.stderr)
+        return False
+    return True
+
+
+def upload_to_testpypi() -> bool:
+    """Uploads dist/ artifacts to TestPyPI.
+
+    Returns:
+        True if the upload succeeded, otherwise False.
+    """
+    return _upload("testpypi", "TestPyPI")
+
+
+def upload_to_pypi() -> bool:
+    """Uploads dist/ artifacts to PyPI.
+
+    Returns:
+        True if the upload succeeded, otherwise False.
+    """
+    return _upload("pypi", "PyPI")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the deploy script.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        Exit code.
+    """
+    parser = argparse.ArgumentParser(
+        description="Build and upload code-recap to PyPI / TestPyPI.",
+    )
+    parser.add_argument(
+        "--test",
+        action="store_true",
+        help="Upload to TestPyPI.",
+    )
+    parser.add_argument(
+        "--production",
+        action="store_true",
+        help="Upload to PyPI.",
+    )
+    parser.add_argument(
+        "--build-only",
+        action="store_true",
+        help="Build the package without uploading.",
+    )
+    parser.add_argument(
+        "--no-clean",
+        action="store_true",
+        help="Keep existing dist/ artifacts instead of cleaning first.",
+    )
+    args = parser.parse_args(argv)
+
+    if not (args.test or args.production or args.build_only):
+        parser.error("Specify --test, --production, or --build-only")
+
+    version = check_version()
+    print(f"Deploying code-recap {version}", file=sys.stderr)
+
+    # Hash build inputs before any cleaning so a valid cached build survives.
+    source_hash = compute_build_hash()
+    if build_is_cached(source_hash, version):
+        print("Sources unchanged since last build; reusing dist/ artifacts.", file=sys.stderr)
+        if args.build_only:
+            return 0
+    else:
+        if not args.no_clean:
+            clean_dist()
+        if not build_package():
+            return 1
+        DIST_DIR.mkdir(exist_ok=True)
+        BUILD_HASH_FILE.write_text(source_hash + "\n")
+
+    if args.build_only:
+        print("Build complete (skipping upload).", file=sys.stderr)
+        return 0
+
+    if args.test and args.production:
+        # TestPyPI and PyPI are independent servers, so the two uploads can
+        # overlap; each is network-bound on transferring sdist+wheel.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(upload_to_testpypi),
+                executor.submit(upload_to_pypi),
+            ]
+            results = [future.result() for future in futures]
+        return 0 if all(results) else 1
+
+    if args.test and not upload_to_testpypi():
+        return 1
+    if args.production and not upload_to_pypi():
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,10 +7,24 @@ with LLM-powered summaries and HTML report generation.
 __version__ = "1.3.1"
 __author__ = "Code Recap Contributors"
 
-from code_recap.paths import get_config_path, get_output_dir
-
 __all__ = [
     "__version__",
     "get_config_path",
     "get_output_dir",
 ]
+
+# Re-exported helpers resolved lazily (PEP 562) so that importing code_recap
+# just for __version__ (the CLI -v/-h paths) loads no submodules.
+_LAZY_ATTRS = {
+    "get_config_path": "paths",
+    "get_output_dir": "paths",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        import importlib
+
+        module = importlib.import_module(f"code_recap.{_LAZY_ATTRS[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
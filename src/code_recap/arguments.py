@@ -62,6 +62,13 @@ def add_fetch_arg(parser: argparse.ArgumentParser, detailed_help: bool = False)
         action="store_true",
         help=help_text,
     )
+    parser.add_argument(
+        "--fetch-jobs",
+        type=int,
+        default=8,
+        metavar="N",
+        help="Number of repositories to fetch in parallel (default: 8).",
+    )
 
 
 def add_config_arg(parser: argparse.ArgumentParser) -> None:
@@ -4,13 +4,52 @@
 Provides a single `code-recap` command with subcommands for all functionality.
 """
 
+from __future__ import annotations
+
 import sys
-from typing import Optional
 
 from code_recap.formatting import print_heading, print_separator
 
+_VERSION: str | None = None
+
+# Subcommand dispatch table: alias -> (module path, entry point name).
+# Modules are imported lazily on dispatch to keep CLI startup fast.
+_DISPATCH: dict[str, tuple[str, str]] = {
+    "summarize": ("code_recap.summarize_activity", "main"),
+    "summary": ("code_recap.summarize_activity", "main"),
+    "report": ("code_recap.summarize_activity", "main"),
+    "daily": ("code_recap.summarize_daily_activity", "main"),
+    "today": ("code_recap.summarize_daily_activity", "main"),
+    "stats": ("code_recap.git_activity_review", "main"),
+    "review": ("code_recap.git_activity_review", "main"),
+    "activity": ("code_recap.git_activity_review", "main"),
+    "html": ("code_recap.generate_html_report", "main"),
+    "html-report": ("code_recap.generate_html_report", "main"),
+    "blog": ("code_recap.generate_blog_post", "main"),
+    "blog-post": ("code_recap.generate_blog_post", "main"),
+    "commits": ("code_recap.list_commits_by_date", "main"),
+    "list-commits": ("code_recap.list_commits_by_date", "main"),
+    "deploy": ("code_recap.deploy_reports", "main"),
+    "git": ("code_recap.git_utils", "main"),
+    "repos": ("code_recap.git_utils", "main"),
+}
+
+
+def _get_version() -> str:
+    """Returns the package version, importing it only once.
+
+    Returns:
+        The code_recap package version string.
+    """
+    global _VERSION
+    if _VERSION is None:
+        from code_recap import __version__
+
+        _VERSION = __version__
+    return _VERSION
+
 
-def main(argv: Optional[list[str]] = None) -> int:
+def main(argv: list[str] | None = None) -> int:
     """Main entry point for the code-recap CLI.
 
     Args:
@@ -29,69 +68,97 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     # Handle version
     if argv[0] in ("-v", "--version"):
-        from code_recap import __version__
-
-        print(f"code-recap {__version__}")
+        print(f"code-recap {_get_version()}")
         return 0
 
     # Route to subcommand
     subcommand = argv[0]
     sub_argv = argv[1:]
 
-    if subcommand in ("summarize", "summary", "report"):
-        from code_recap.summarize_activity import main as summarize_main
+    entry = _DISPATCH.get(subcommand)
+    if entry is not None:
+        import importlib
 
-        return summarize_main(sub_argv)
+        module = importlib.import_module(entry[0])
+        return getattr(module, entry[1])(sub_argv)
 
-    elif subcommand in ("daily", "today"):
-        from code_recap.summarize_daily_activity import main as daily_main
-
-        return daily_main(sub_argv)
+    if subcommand in ("init", "config"):
+        return init_config(sub_argv)
 
-    elif subcommand in ("stats", "review", "activity"):
-        from code_recap.git_activity_review import main as review_main
+    elif subcommand == "help":
+        if sub_argv:
+            # Show help for specific subcommand
+            return main([sub_argv[0], "--help"])
+        print_help()
+        return 0
 
-        return review_main(sub_argv)
+    else:
+        print(f"Unknown subcommand: {subcommand}", file=sys.stderr)
+        print("Run 'code-recap --help' for available commands.", file=sys.stderr)
+        return 1
 
-    elif subcommand in ("html", "html-report"):
-        from code_recap.generate_html_report import main as html_main
 
-        return html_main(sub_argv)
+# Template for generated config.yaml; the two blocks are filled in from the
+# interactive prompts (or with commented examples when skipped).
+_CONFIG_TEMPLATE = """\
+# Code Recap Configuration
+# See: https://github.com/NRB-Tech/code-recap
 
-    elif subcommand in ("blog", "blog-post"):
-        from code_recap.generate_blog_post import main as blog_main
+{global_context_block}
 
-        return blog_main(sub_argv)
+# Client configuration (optional - for consultants with multiple clients)
+# clients:
+#   "Client Name":
+#     directories:
+#       - "project-*"      # Glob patterns for repo names
+#     context: |
+#       Brief description of work for this client.
 
-    elif subcommand in ("commits", "list-commits"):
-        from code_recap.list_commits_by_date import main as commits_main
+# File patterns to exclude from statistics (optional)
+# excludes:
+#   global:
+#     - "*.lock"
+#     - "package-lock.json"
+#     - "*/node_modules/*"
 
-        return commits_main(sub_argv)
+{branding_block}
+"""
 
-    elif subcommand in ("deploy",):
-        from code_recap.deploy_reports import main as deploy_main
+_GLOBAL_CONTEXT_EXAMPLE = """\
+# Global context for LLM summaries (optional)
+# global_context: |
+#   Brief description of your work for context in summaries."""
 
-        return deploy_main(sub_argv)
+_BRANDING_EXAMPLE = """\
+# HTML report branding (optional)
+# html_report:
+#   company:
+#     name: "Your Company"
+#     url: "https://example.com"
+#   accent_primary: "#2563eb\""""
 
-    elif subcommand in ("git", "repos"):
-        from code_recap.git_utils import main as git_main
 
-        return git_main(sub_argv)
+def _write_secure(path, content: str, append: bool = False) -> None:
+    """Writes a file containing secrets with owner-only permissions.
 
-    elif subcommand in ("init", "config"):
-        return init_config(sub_argv)
+    Opens with mode 0o600 at creation so the file never exists with the
+    default permissions, and tightens pre-existing files; one open/write
+    pair instead of separate write and chmod calls.
 
-    elif subcommand == "help":
-        if sub_argv:
-            # Show help for specific subcommand
-            return main([sub_argv[0], "--help"])
-        print_help()
-        return 0
+    Args:
+        path: Destination file path.
+        content: Text content to write.
+        append: If True, append instead of truncating.
+    """
+    import os
 
-    else:
-        print(f"Unknown subcommand: {subcommand}", file=sys.stderr)
-        print("Run 'code-recap --help' for available commands.", file=sys.stderr)
-        return 1
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+    fd = os.open(str(path), flags, 0o600)
+    try:
+        os.write(fd, content.encode())
+    finally:
+        os.close(fd)
+    os.chmod(path, 0o600)
 
 
 def init_config(argv: list[str]) -> int:
@@ -171,77 +238,32 @@ def init_config(argv: list[str]) -> int:
                 website = ""
                 description = ""
 
-            # Build config content
-            config_lines = [
-                "# Code Recap Configuration",
-                "# See: https://github.com/NRB-Tech/code-recap",
-                "",
-            ]
-
-            # Global context
+            # Global context block
             if description:
-                config_lines.append("# Context for LLM summaries")
-                config_lines.append("global_context: |")
-                for line in description.split("\n"):
-                    config_lines.append(f"  {line}")
-                config_lines.append("")
+                indented = "\n".join(f"  {line}" for line in description.split("\n"))
+                global_context_block = f"# Context for LLM summaries\nglobal_context: |\n{indented}"
             else:
-                config_lines.extend(
-                    [
-                        "# Global context for LLM summaries (optional)",
-                        "# global_context: |",
-                        "#   Brief description of your work for context in summaries.",
-                        "",
-                    ]
-                )
-
-            # Client configuration (always commented as example)
-            config_lines.extend(
-                [
-                    "# Client configuration (optional - for consultants with multiple clients)",
-                    "# clients:",
-                    '#   "Client Name":',
-                    "#     directories:",
-                    '#       - "project-*"      # Glob patterns for repo names',
-                    "#     context: |",
-                    "#       Brief description of work for this client.",
-                    "",
-                    "# File patterns to exclude from statistics (optional)",
-                    "# excludes:",
-                    "#   global:",
-                    '#     - "*.lock"',
-                    '#     - "package-lock.json"',
-                    '#     - "*/node_modules/*"',
-                    "",
-                ]
-            )
+                global_context_block = _GLOBAL_CONTEXT_EXAMPLE
 
-            # HTML report branding
+            # HTML report branding block
             if org_name or website:
-                config_lines.append("# HTML report branding")
-                config_lines.append("html_report:")
-                config_lines.append("  company:")
+                branding_lines = ["# HTML report branding", "html_report:", "  company:"]
                 if org_name:
-                    config_lines.append(f'    name: "{org_name}"')
+                    branding_lines.append(f'    name: "{org_name}"')
                 if website:
-                    config_lines.append(f'    url: "{website}"')
-                config_lines.append('  # accent_primary: "#2563eb"')
-                config_lines.append("")
+                    branding_lines.append(f'    url: "{website}"')
+                branding_lines.append('  # accent_primary: "#2563eb"')
+                branding_block = "\n".join(branding_lines)
             else:
-                config_lines.extend(
-                    [
-                        "# HTML report branding (optional)",
-                        "# html_report:",
-                        "#   company:",
-                        '#     name: "Your Company"',
-                        '#     url: "https://example.com"',
-                        '#   accent_primary: "#2563eb"',
-                        "",
-                    ]
-                )
+                branding_block = _BRANDING_EXAMPLE
+
+            rendered = _CONFIG_TEMPLATE.format(
+                global_context_block=global_context_block,
+                branding_block=branding_block,
+            )
 
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text("\n".join(config_lines))
+            output_path.write_text(rendered)
             created_files.append(str(output_path))
 
     # Set up API keys
@@ -257,25 +279,40 @@ def init_config(argv: list[str]) -> int:
 
         keys: dict[str, str] = {}  # provider -> key
 
-        # Prompt for each key
-        for name, env_var, example in [
-            ("OpenAI", "OPENAI_API_KEY", "sk-..."),
-            ("Gemini", "GEMINI_API_KEY", "AI..."),
-            ("Anthropic", "ANTHROPIC_API_KEY", "sk-ant-..."),
-        ]:
-            # Check if already set in environment
-            existing = os.environ.get(env_var)
-            if existing:
-                print(f"{name}: Already set in environment ✓")
-                continue
-
+        # Open the controlling tty once and share it across the prompts
+        # instead of letting each getpass call reopen it.
+        tty = None
+        if os.path.exists("/dev/tty"):
             try:
-                key = getpass.getpass(f"{name} API key ({example}): ").strip()
-                if key:
-                    keys[name.lower()] = key
-            except (KeyboardInterrupt, EOFError):
-                print("\nSkipping remaining keys...")
-                break
+                # Deliberately long-lived across the prompts; closed in the
+                # finally below.
+                tty = open("/dev/tty", "w")  # noqa: SIM115
+            except OSError:
+                tty = None
+
+        try:
+            # Prompt for each key
+            for name, env_var, example in [
+                ("OpenAI", "OPENAI_API_KEY", "sk-..."),
+                ("Gemini", "GEMINI_API_KEY", "AI..."),
+                ("Anthropic", "ANTHROPIC_API_KEY", "sk-ant-..."),
+            ]:
+                # Check if already set in environment
+                existing = os.environ.get(env_var)
+                if existing:
+                    print(f"{name}: Already set in environment ✓")
+                    continue
+
+                try:
+                    key = getpass.getpass(f"{name} API key ({example}): ", stream=tty).strip()
+                    if key:
+                        keys[name.lower()] = key
+                except (KeyboardInterrupt, EOFError):
+                    print("\nSkipping remaining keys...")
+                    break
+        finally:
+            if tty is not None:
+                tty.close()
 
         # Add keys to config.yaml
         if keys:
@@ -296,9 +333,8 @@ def init_config(argv: list[str]) -> int:
                         data["api_keys"] = {}
                     data["api_keys"].update(keys)
 
-                    # Write back, preserving comments if possible by appending
-                    with open(output_path, "w") as f:
-                        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+                    rendered = yaml.dump(data, default_flow_style=False, sort_keys=False)
+                    _write_secure(output_path, rendered)
                     print(f"\nUpdated API keys in {output_path}")
                 except Exception as e:
                     print(f"Warning: Could not update config: {e}", file=sys.stderr)
@@ -314,8 +350,7 @@ def init_config(argv: list[str]) -> int:
                 api_keys_section.append("")
 
                 output_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_path, "a") as f:
-                    f.write("\n".join(api_keys_section))
+                _write_secure(output_path, "\n".join(api_keys_section), append=True)
                 print(f"\nAdded API keys to {output_path}")
 
             keys_added = True
@@ -350,11 +385,9 @@ code-recap stats 2025 --format markdown
     return 0
 
 
-def print_help() -> None:
-    """Prints the main help message."""
-    from code_recap import __version__
-
-    help_text = f"""code-recap {__version__} - Git activity summaries powered by LLMs
+# Help text is a module constant so print_help only fills in the version
+# instead of rebuilding the whole string on every -h invocation.
+_HELP = """code-recap {version} - Git activity summaries powered by LLMs
 
 Usage: code-recap <command> [options]
 
@@ -392,7 +425,11 @@ Environment variables:
   GEMINI_API_KEY       For Google Gemini models
   ANTHROPIC_API_KEY    For Claude models
 """
-    print(help_text)
+
+
+def print_help() -> None:
+    """Prints the main help message."""
+    print(_HELP.format(version=_get_version()))
 
 
 if __name__ == "__main__":
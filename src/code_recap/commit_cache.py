@@ -0,0 +1,121 @@
+"""Persistent on-disk cache for retrieved commits.
+
+Commit SHAs are immutable, so the (repo, sha, max_diff_lines) -> CommitInfo
+mapping never goes stale. Caching it under ~/.cache/code-recap lets repeated
+research/write/full runs skip `git show` entirely for commits they have
+already retrieved.
+
+The cache is strictly best-effort: any sqlite or filesystem error disables it
+for the rest of the process and callers fall back to git.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Optional
+
+from code_recap.git_utils import CommitInfo
+from code_recap.paths import get_cache_dir
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS commits (
+    repo_path TEXT NOT NULL,
+    sha TEXT NOT NULL,
+    max_diff_lines INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (repo_path, sha, max_diff_lines)
+)
+"""
+
+_lock = threading.Lock()
+_connection: Optional[sqlite3.Connection] = None
+_disabled = False
+
+
+def _connect() -> Optional[sqlite3.Connection]:
+    """Opens (once) the shared cache database connection.
+
+    Returns:
+        The sqlite connection, or None if the cache is unavailable.
+    """
+    global _connection, _disabled
+    if _disabled:
+        return None
+    if _connection is None:
+        try:
+            cache_dir = get_cache_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(cache_dir / "commits.db"), check_same_thread=False)
+            # WAL keeps concurrent readers from blocking on writes.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            _connection = conn
+        except (sqlite3.Error, OSError):
+            _disabled = True
+            return None
+    return _connection
+
+
+def get_cached_commit(repo_path: str, sha: str, max_diff_lines: int) -> Optional[CommitInfo]:
+    """Looks up a previously retrieved commit.
+
+    Args:
+        repo_path: Path to the repository.
+        sha: Commit SHA as requested (full or prefix).
+        max_diff_lines: Diff line limit the commit was retrieved with.
+
+    Returns:
+        The cached CommitInfo, or None on a miss or cache error.
+    """
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT payload FROM commits WHERE repo_path=? AND sha=? AND max_diff_lines=?",
+                (os.path.realpath(repo_path), sha, max_diff_lines),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+    if row is None:
+        return None
+    try:
+        return CommitInfo(**json.loads(row[0]))
+    except (ValueError, TypeError):
+        return None
+
+
+def cache_commit(repo_path: str, sha: str, max_diff_lines: int, commit: CommitInfo) -> None:
+    """Stores a retrieved commit for future runs.
+
+    Args:
+        repo_path: Path to the repository.
+        sha: Commit SHA as requested (full or prefix).
+        max_diff_lines: Diff line limit the commit was retrieved with.
+        commit: The commit to store.
+    """
+    payload = json.dumps(
+        {
+            "sha": commit.sha,
+            "author_date": commit.author_date,
+            "author_name": commit.author_name,
+            "subject": commit.subject,
+            "body": commit.body,
+            "diff": commit.diff,
+        }
+    )
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO commits VALUES (?, ?, ?, ?)",
+                (os.path.realpath(repo_path), sha, max_diff_lines, payload),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
@@ -16,17 +16,19 @@ def print_separator(width: int = DEFAULT_WIDTH, file: TextIO = sys.stderr) -> No
         width: Width of the separator line in characters.
         file: Output stream (default: sys.stderr).
     """
-    print("=" * width, file=file)
+    file.write("=" * width + "\n")
 
 
 def print_heading(title: str, width: int = DEFAULT_WIDTH, file: TextIO = sys.stderr) -> None:
     """Prints a section heading with separator lines.
 
+    The banner is emitted as a single write so unbuffered streams (e.g.
+    stderr on some CI hosts) flush once per heading instead of per line.
+
     Args:
         title: The heading text to display.
         width: Width of the separator lines in characters.
         file: Output stream (default: sys.stderr).
     """
-    print_separator(width, file)
-    print(title, file=file)
-    print_separator(width, file)
+    separator = "=" * width
+    file.write(f"{separator}\n{title}\n{separator}\n")
@@ -13,12 +13,21 @@ variables (OPENAI_API_KEY, ANTHROPIC_API_KEY, or GEMINI_API_KEY).
 """
 
 import argparse
+import contextlib
 import datetime as _dt
+import functools
+import hashlib
+import io
+import json
 import os
 import re
 import sys
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Union
+from pathlib import Path
+from typing import Optional, TextIO, Union
 
 from code_recap.arguments import (
     add_author_arg,
@@ -29,6 +38,7 @@ from code_recap.arguments import (
     add_root_arg,
     resolve_author,
 )
+from code_recap.commit_cache import cache_commit, get_cached_commit
 from code_recap.formatting import print_heading
 from code_recap.git_activity_review import (
     date_range_to_git_args,
@@ -41,17 +51,30 @@ from code_recap.git_utils import (
     fetch_repos_with_progress,
     get_commits_with_diffs,
     run_git,
+    run_git_truncated,
 )
 from code_recap.paths import get_config_path, load_api_keys_from_config
 from code_recap.summarize_activity import (
     RECOMMENDED_MODELS,
     CostTracker,
+    _get_model_cost_table,
     call_llm,
+    call_llm_parallel,
     load_config,
 )
 
 DEFAULT_MODEL = "gpt-4o-mini"
 
+# Pre-compiled patterns for research markdown parsing; these run on every
+# research/write invocation (and per chunk if content is ever streamed).
+_META_RE = re.compile(r"<!--\s*blog-research-meta\s*\n(.*?)\n-->", re.DOTALL)
+_SECTION_SPLIT_RE = re.compile(r"(?=^###\s)", re.MULTILINE)
+_COMMITS_LINE_RE = re.compile(r"\*\*Commits?\*\*:\s*(.+?)(?:\n|$)", re.IGNORECASE)
+_REPO_LINE_RE = re.compile(r"\*\*Repository\*\*:\s*(.+?)(?:\n|$)", re.IGNORECASE)
+_SHA_RE = re.compile(r"`([a-f0-9]{7,8})`")
+_INLINE_SHA_RE = re.compile(r"`([a-f0-9]{7,8})`(?:\s*\(([^)]+)\))?")
+_SLUG_RE = re.compile(r"[^\w\-]+")
+
 # Research stage system prompt
 RESEARCH_SYSTEM_PROMPT = """You are an expert software developer analyzing git commits to identify material for a blog post.
 
@@ -210,8 +233,7 @@ def parse_research_metadata(content: str) -> Optional[ResearchMetadata]:
         ResearchMetadata if found and valid, None otherwise.
     """
     # Look for the metadata comment
-    pattern = r"<!--\s*blog-research-meta\s*\n(.*?)\n-->"
-    match = re.search(pattern, content, re.DOTALL)
+    match = _META_RE.search(content)
     if not match:
         return None
 
@@ -222,7 +244,11 @@ def parse_research_metadata(content: str) -> Optional[ResearchMetadata]:
         return None
 
     try:
-        data = yaml.safe_load(match.group(1))
+        # Use the libyaml-backed loader when PyYAML was built with it; the
+        # C scanner is roughly an order of magnitude faster than the pure
+        # Python one and the commits list grows with each research run.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(match.group(1), Loader=loader)
         if not data:
             return None
 
@@ -265,13 +291,13 @@ def extract_commit_shas_from_research(content: str) -> list[tuple[str, str]]:
 
     # First, extract from structured sections (### Title ... **Commits**: ... **Repository**: ...)
     # Split by section headers to process each section
-    sections = re.split(r"(?=^###\s)", content, flags=re.MULTILINE)
+    sections = _SECTION_SPLIT_RE.split(content)
 
     for section in sections:
         # Look for **Commits**: line with backtick-wrapped SHAs
-        commits_match = re.search(r"\*\*Commits?\*\*:\s*(.+?)(?:\n|$)", section, re.IGNORECASE)
+        commits_match = _COMMITS_LINE_RE.search(section)
         # Look for **Repository**: line
-        repo_match = re.search(r"\*\*Repository\*\*:\s*(.+?)(?:\n|$)", section, re.IGNORECASE)
+        repo_match = _REPO_LINE_RE.search(section)
 
         if commits_match:
             commits_line = commits_match.group(1)
@@ -280,31 +306,27 @@ def extract_commit_shas_from_research(content: str) -> list[tuple[str, str]]:
             repo_name = repo_name.strip("`")
 
             # Extract all SHAs from the commits line
-            sha_pattern = r"`([a-f0-9]{7,8})`"
-            shas = re.findall(sha_pattern, commits_line)
+            shas = _SHA_RE.findall(commits_line)
 
             for sha in shas:
                 if sha not in seen_shas:
                     seen_shas.add(sha)
                     results.append((sha, repo_name))
 
-    # Also check for inline format: `abc123de` (RepoName) or `abc123de` (Repo-Name)
-    inline_pattern = r"`([a-f0-9]{7,8})`\s*\(([^)]+)\)"
-    inline_matches = re.findall(inline_pattern, content)
-
-    for sha, repo in inline_matches:
-        if sha not in seen_shas:
-            seen_shas.add(sha)
-            results.append((sha, repo.strip()))
-
-    # Finally, extract any remaining standalone SHAs not yet captured
-    all_sha_pattern = r"`([a-f0-9]{7,8})`"
-    all_shas = re.findall(all_sha_pattern, content)
-
-    for sha in all_shas:
+    # One combined pass over the full content catches both the inline format
+    # (`abc123de` (RepoName)) and bare `abc123de` references; the optional
+    # repo group saves a second scan of what can be a very large document.
+    for sha, repo in _INLINE_SHA_RE.findall(content):
+        repo = repo.strip() if repo else ""
         if sha not in seen_shas:
             seen_shas.add(sha)
-            results.append((sha, ""))
+            results.append((sha, repo))
+        elif repo:
+            # A bare reference seen earlier may now gain its repo annotation.
+            for i, (existing_sha, existing_repo) in enumerate(results):
+                if existing_sha == sha and not existing_repo:
+                    results[i] = (sha, repo)
+                    break
 
     return results
 
@@ -601,17 +623,30 @@ def format_research_metadata(
     return "\n".join(lines)
 
 
-def get_commit_by_sha(repo_path: str, sha: str, max_diff_lines: int = 500) -> Optional[CommitInfo]:
+def get_commit_by_sha(
+    repo_path: str, sha: str, max_diff_lines: int = 500, include_stat: Optional[bool] = None
+) -> Optional[CommitInfo]:
     """Retrieves a specific commit by SHA with its diff.
 
     Args:
         repo_path: Path to the repository.
         sha: Commit SHA (full or prefix).
         max_diff_lines: Maximum diff lines to include.
+        include_stat: Whether to prepend the --stat summary to the diff.
+            Defaults to skipping it for small line budgets (< 50), where the
+            stat both costs git an extra tree walk and eats most of the
+            budget. Keeping the default tied to max_diff_lines also keeps it
+            consistent with the on-disk commit cache key.
 
     Returns:
         CommitInfo if found, None otherwise.
     """
+    if include_stat is None:
+        include_stat = max_diff_lines >= 50
+    cached = get_cached_commit(repo_path, sha, max_diff_lines)
+    if cached:
+        return cached
+
     # Get commit info
     args = [
         "show",
@@ -635,20 +670,21 @@ def get_commit_by_sha(repo_path: str, sha: str, max_diff_lines: int = 500) -> Op
     subject = parts[3]
     body = parts[4].strip() if len(parts) > 4 else ""
 
-    # Get the diff
-    diff_args = ["show", "--no-color", "--format=", "--stat", "--patch", sha]
-    diff_code, diff_out, _ = run_git(repo_path, diff_args)
+    # Get the diff, stopping the read at the line limit rather than
+    # materializing the whole patch first.
+    diff_args = ["show", "--no-color", "--format="]
+    if include_stat:
+        diff_args.append("--stat")
+    diff_args += ["--patch", sha]
+    diff_code, diff_out, diff_truncated = run_git_truncated(repo_path, diff_args, max_diff_lines)
 
     diff_content = ""
     if diff_code == 0:
-        diff_lines = diff_out.split("\n")
-        if len(diff_lines) > max_diff_lines:
-            diff_content = "\n".join(diff_lines[:max_diff_lines])
-            diff_content += f"\n... (truncated, {len(diff_lines) - max_diff_lines} more lines)"
-        else:
-            diff_content = diff_out
+        diff_content = diff_out
+        if diff_truncated:
+            diff_content += "... (truncated)"
 
-    return CommitInfo(
+    commit = CommitInfo(
         sha=full_sha,
         author_date=author_date,
         author_name=author_name,
@@ -656,14 +692,186 @@ def get_commit_by_sha(repo_path: str, sha: str, max_diff_lines: int = 500) -> Op
         body=body,
         diff=diff_content,
     )
+    cache_commit(repo_path, sha, max_diff_lines, commit)
+    return commit
+
+
+def _truncate_diff(diff: str, max_diff_lines: int) -> str:
+    """Truncates a diff to a maximum number of lines.
+
+    Args:
+        diff: Full diff text.
+        max_diff_lines: Maximum lines to keep.
+
+    Returns:
+        The diff, with a truncation marker appended if it exceeded the limit.
+    """
+    lines = diff.split("\n")
+    if len(lines) <= max_diff_lines:
+        return diff
+    return (
+        "\n".join(lines[:max_diff_lines])
+        + f"\n... (truncated, {len(lines) - max_diff_lines} more lines)"
+    )
+
+
+def get_commits_by_shas(
+    repo_path: str,
+    shas: Sequence[str],
+    max_diff_lines: int = 500,
+    include_stat: Optional[bool] = None,
+) -> dict[str, CommitInfo]:
+    """Retrieves several commits from one repository in a single git call.
+
+    Spawning `git show` twice per SHA dominates retrieval time when research
+    output references many commits; batching amortizes process startup and
+    git's object-cache warmup across the whole set.
+
+    Args:
+        repo_path: Path to the repository.
+        shas: Commit SHAs (full or prefix) to retrieve.
+        max_diff_lines: Maximum diff lines per commit.
+        include_stat: Whether to include the --stat summary before each
+            diff; defaults to skipping it for small line budgets (< 50), as
+            in get_commit_by_sha.
+
+    Returns:
+        Mapping of each requested SHA to its CommitInfo. SHAs not found in
+        this repository are absent from the result.
+    """
+    if not shas:
+        return {}
+    if include_stat is None:
+        include_stat = max_diff_lines >= 50
+
+    results: dict[str, CommitInfo] = {}
+    to_fetch = []
+    for sha in shas:
+        cached = get_cached_commit(repo_path, sha, max_diff_lines)
+        if cached:
+            results[sha] = cached
+        else:
+            to_fetch.append(sha)
+    if not to_fetch:
+        return results
+
+    # Resolve prefixes to full SHAs (and drop unknowns) with one cheap
+    # batch-check, so a bad reference cannot fail the whole `git log` call.
+    code, out, _ = run_git(
+        repo_path,
+        ["cat-file", "--batch-check"],
+        input_text="".join(f"{sha}^{{commit}}\n" for sha in to_fetch),
+    )
+    if code != 0:
+        return results
+    resolved: list[tuple[str, str]] = []
+    for requested, line in zip(to_fetch, out.splitlines()):
+        parts = line.split()
+        if len(parts) == 3 and parts[1] == "commit":
+            resolved.append((requested, parts[0]))
+    if not resolved:
+        return results
 
+    args = [
+        "log",
+        "--no-walk=unsorted",
+        "--stdin",
+        "--no-color",
+        "--format=%x00%H%x1f%ad%x1f%an%x1f%s%x1f%b%x1e",
+        "--date=iso-local",
+    ]
+    if include_stat:
+        args.append("--stat")
+    args.append("--patch")
+    code, out, _ = run_git(
+        repo_path, args, input_text="".join(f"{full_sha}\n" for _, full_sha in resolved)
+    )
+    if code != 0:
+        return results
 
-def find_repo_by_name(root: str, repo_name: str) -> Optional[str]:
+    by_full_sha: dict[str, CommitInfo] = {}
+    for record in out.split("\x00"):
+        if not record.strip():
+            continue
+        meta, _, diff = record.partition("\x1e")
+        parts = meta.split("\x1f")
+        if len(parts) < 4:
+            continue
+        # With a non-empty --format, git log inserts a "---" separator line
+        # before the --stat section; git show --format= does not, so drop it
+        # to keep both retrieval paths (and their cache entries) identical.
+        diff = diff.lstrip("\n")
+        if diff.startswith("---\n"):
+            diff = diff[4:]
+        by_full_sha[parts[0]] = CommitInfo(
+            sha=parts[0],
+            author_date=parts[1],
+            author_name=parts[2],
+            subject=parts[3],
+            body=parts[4].strip() if len(parts) > 4 else "",
+            diff=_truncate_diff(diff, max_diff_lines),
+        )
+
+    for requested, full_sha in resolved:
+        commit = by_full_sha.get(full_sha)
+        if commit:
+            results[requested] = commit
+            cache_commit(repo_path, requested, max_diff_lines, commit)
+    return results
+
+
+@functools.lru_cache(maxsize=32)
+def _discover_repo_paths(root: str) -> list[str]:
+    """Lists top-level repositories and their submodules under a root.
+
+    Memoized per root: discovery walks the filesystem and spawns a git
+    subprocess per repo with submodules, and the layout does not change
+    within one CLI invocation.
+
+    Args:
+        root: Root directory containing repositories.
+
+    Returns:
+        Repository paths in discovery order (each repo followed by its
+        submodules).
+    """
+    paths: list[str] = []
+    for repo_path in discover_top_level_repos(root):
+        paths.append(repo_path)
+        paths.extend(discover_all_submodules(repo_path))
+    return paths
+
+
+@functools.lru_cache(maxsize=32)
+def _build_repo_index(root: str) -> dict[str, str]:
+    """Builds a lowercase-basename index of repositories under a root.
+
+    Memoized per root, so repeated find_repo_by_name calls hit a dict
+    lookup instead of rescanning.
+
+    Args:
+        root: Root directory containing repositories.
+
+    Returns:
+        Mapping of lowercased repo basename to path. On basename clashes
+        the first discovered path wins, matching the old scan order.
+    """
+    index: dict[str, str] = {}
+    for path in _discover_repo_paths(root):
+        index.setdefault(os.path.basename(path).lower(), path)
+    return index
+
+
+def find_repo_by_name(
+    root: str, repo_name: str, index: Optional[dict[str, str]] = None
+) -> Optional[str]:
     """Finds a repository path by name.
 
     Args:
         root: Root directory containing repositories.
         repo_name: Name of the repository to find.
+        index: Optional prebuilt index from _build_repo_index; avoids
+            re-discovering repositories when resolving many names.
 
     Returns:
         Full path to the repository, or None if not found.
@@ -673,16 +881,9 @@ def find_repo_by_name(root: str, repo_name: str) -> Optional[str]:
     if os.path.isdir(direct_path):
         return direct_path
 
-    # Search all repos and submodules
-    for repo_path in discover_top_level_repos(root):
-        if os.path.basename(repo_path).lower() == repo_name.lower():
-            return repo_path
-        # Check submodules
-        for sub_path in discover_all_submodules(repo_path):
-            if os.path.basename(sub_path).lower() == repo_name.lower():
-                return sub_path
-
-    return None
+    if index is None:
+        index = _build_repo_index(root)
+    return index.get(repo_name.lower())
 
 
 def get_file_at_commit(repo_path: str, file_path: str, sha: str) -> Optional[str]:
@@ -796,42 +997,49 @@ def retrieve_referenced_commits(
     Returns:
         List of (repo_name, CommitInfo) tuples for found commits.
     """
-    results: list[tuple[str, CommitInfo]] = []
-    seen_shas: set[str] = set()
-
     # Combine metadata commits and extracted refs
     all_refs = list(metadata.commits) + additional_refs
 
-    root = metadata.root or os.path.dirname(os.getcwd())
+    root = metadata.root or _default_root()
+
+    # Discover repos and submodules once; per-SHA rediscovery dominated the
+    # cost of this loop when many commits were referenced.
+    repo_paths = _discover_repo_paths(root)
+    repo_index = _build_repo_index(root)
 
+    # Group SHAs by resolved repo so each repository needs a single batched
+    # git call instead of two `git show` spawns per commit.
+    ordered_shas: list[str] = []
+    names: dict[str, str] = {}
+    by_repo: dict[str, list[str]] = {}
+    seen_shas: set[str] = set()
     for sha_prefix, repo_name in all_refs:
         if sha_prefix in seen_shas:
             continue
         seen_shas.add(sha_prefix)
-
-        # Find the repo
+        ordered_shas.append(sha_prefix)
         if repo_name:
-            repo_path = find_repo_by_name(root, repo_name)
+            repo_path = find_repo_by_name(root, repo_name, index=repo_index)
             if repo_path:
-                commit = get_commit_by_sha(repo_path, sha_prefix, max_diff_lines)
-                if commit:
-                    results.append((repo_name, commit))
-                    continue
-
-        # If no repo specified or not found, search all repos
-        for repo_path in discover_top_level_repos(root):
-            commit = get_commit_by_sha(repo_path, sha_prefix, max_diff_lines)
-            if commit:
-                results.append((os.path.basename(repo_path), commit))
-                break
-            # Check submodules
-            for sub_path in discover_all_submodules(repo_path):
-                commit = get_commit_by_sha(sub_path, sha_prefix, max_diff_lines)
-                if commit:
-                    results.append((os.path.basename(sub_path), commit))
-                    break
+                by_repo.setdefault(repo_path, []).append(sha_prefix)
+                names[sha_prefix] = repo_name
 
-    return results
+    found: dict[str, tuple[str, CommitInfo]] = {}
+    for repo_path, repo_shas in by_repo.items():
+        for sha_prefix, commit in get_commits_by_shas(repo_path, repo_shas, max_diff_lines).items():
+            found[sha_prefix] = (names[sha_prefix], commit)
+
+    # SHAs with no repo annotation, or not found where expected: search all
+    # repos, still batching the remaining SHAs per repository.
+    missing = [sha for sha in ordered_shas if sha not in found]
+    for repo_path in repo_paths:
+        if not missing:
+            break
+        for sha_prefix, commit in get_commits_by_shas(repo_path, missing, max_diff_lines).items():
+            found[sha_prefix] = (os.path.basename(repo_path), commit)
+        missing = [sha for sha in missing if sha not in found]
+
+    return [found[sha] for sha in ordered_shas if sha in found]
 
 
 def gather_commits_for_period(
@@ -857,26 +1065,32 @@ def gather_commits_for_period(
     all_commits: list[tuple[str, CommitInfo]] = []
     seen_shas: set[str] = set()
 
+    # Build the full scan list (repos plus submodules) up front so every
+    # git log subprocess can run concurrently; each scan is dominated by
+    # waiting on git rather than Python work.
+    tasks: list[tuple[str, str]] = []
     for repo_path in repos:
-        repo_name = os.path.basename(repo_path)
-
-        # Get commits from main repo
-        commits = get_commits_with_diffs(repo_path, since_str, until_str, author, max_diff_lines)
-        for c in commits:
-            if c.sha not in seen_shas:
-                seen_shas.add(c.sha)
-                all_commits.append((repo_name, c))
-
-        # Get commits from submodules
+        tasks.append((os.path.basename(repo_path), repo_path))
         for sub_path in discover_all_submodules(repo_path):
-            sub_name = os.path.basename(sub_path)
-            sub_commits = get_commits_with_diffs(
-                sub_path, since_str, until_str, author, max_diff_lines
+            tasks.append((os.path.basename(sub_path), sub_path))
+
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(tasks)))) as executor:
+        futures = [
+            (
+                name,
+                executor.submit(
+                    get_commits_with_diffs, path, since_str, until_str, author, max_diff_lines
+                ),
             )
-            for c in sub_commits:
+            for name, path in tasks
+        ]
+        # Collect in submission order so output (and SHA dedup) stays
+        # deterministic regardless of completion order.
+        for name, future in futures:
+            for c in future.result():
                 if c.sha not in seen_shas:
                     seen_shas.add(c.sha)
-                    all_commits.append((sub_name, c))
+                    all_commits.append((name, c))
 
     return all_commits
 
@@ -893,29 +1107,106 @@ def format_commits_for_prompt(commits: list[tuple[str, CommitInfo]]) -> str:
     if not commits:
         return "No commits found in the specified period."
 
-    lines = [f"# Git Commits ({len(commits)} total)", ""]
+    # Write into a single buffer rather than accumulating per-line f-strings;
+    # with hundreds of multi-KB diffs the intermediate list dominated
+    # allocation in this function.
+    buf = io.StringIO()
+    write = buf.write
+    write(f"# Git Commits ({len(commits)} total)\n\n")
 
     # Sort by date
     sorted_commits = sorted(commits, key=lambda x: x[1].author_date)
 
+    # Cherry-picks and submodule mirrors often carry byte-identical diffs;
+    # embed each distinct diff once and reference it from the duplicates,
+    # since prompt tokens are the dominant cost here.
+    seen_diffs: dict[str, str] = {}
+
     for repo_name, commit in sorted_commits:
-        lines.append(f"## Commit: {commit.sha[:8]} ({repo_name})")
-        lines.append(f"**Date**: {commit.author_date}")
-        lines.append(f"**Author**: {commit.author_name}")
-        lines.append(f"**Subject**: {commit.subject}")
+        write(f"## Commit: {commit.sha[:8]} ({repo_name})\n")
+        write(f"**Date**: {commit.author_date}\n")
+        write(f"**Author**: {commit.author_name}\n")
+        write(f"**Subject**: {commit.subject}\n")
         if commit.body:
-            lines.append(f"**Body**:\n{commit.body}")
-        lines.append("")
+            write(f"**Body**:\n{commit.body}\n")
+        write("\n")
         if commit.diff:
-            lines.append("**Diff**:")
-            lines.append("```diff")
-            lines.append(commit.diff)
-            lines.append("```")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+            digest = hashlib.blake2b(commit.diff.encode(), digest_size=8).hexdigest()
+            original_sha = seen_diffs.get(digest)
+            if original_sha is None:
+                seen_diffs[digest] = commit.sha[:8]
+                write("**Diff**:\n```diff\n")
+                write(commit.diff)
+                write("\n```\n")
+            else:
+                write(f"**Diff**: identical to commit {original_sha} above\n")
+        write("\n---\n\n")
 
-    return "\n".join(lines)
+    # The old "\n".join() ended after the final separator without a blank line.
+    return buf.getvalue().removesuffix("\n")
+
+
+def _build_system_prompt(base_prompt: str, global_context: str, client_context: str) -> str:
+    """Appends the company/client context block to a stage's system prompt.
+
+    All three stages build their system prompt the same way; a single
+    builder keeps the context block byte-identical across stages, which is
+    what lets the provider's prompt-prefix cache carry it between the
+    research, write, and review calls of one run.
+
+    Args:
+        base_prompt: The stage's base system prompt.
+        global_context: Company context, if any.
+        client_context: Client-specific context, if any.
+
+    Returns:
+        The full system prompt.
+    """
+    if not (global_context or client_context):
+        return base_prompt
+    parts = [base_prompt, "\n\n---\n\nContext:\n"]
+    if global_context:
+        parts.append(f"\nCompany Background:\n{global_context}\n")
+    if client_context:
+        parts.append(f"\nClient Context:\n{client_context}\n")
+    return "".join(parts)
+
+
+# Per-chunk character budget for the research stage, ~40k tokens at the usual
+# ~4 characters per token. Keeps each map call well inside model context.
+_RESEARCH_CHUNK_CHARS = 160_000
+
+
+def _chunk_commits(
+    commits: list[tuple[str, CommitInfo]], max_chars: int
+) -> list[list[tuple[str, CommitInfo]]]:
+    """Greedily packs commits into chunks under a character budget.
+
+    Character counts stand in for tokens (~4 chars/token), which is accurate
+    enough for sizing prompts without a tokenizer dependency.
+
+    Args:
+        commits: List of (repo_name, CommitInfo) tuples.
+        max_chars: Approximate maximum characters of commit content per chunk.
+
+    Returns:
+        Chunks in input order; a single oversized commit still gets its own
+        chunk rather than being split.
+    """
+    chunks: list[list[tuple[str, CommitInfo]]] = []
+    current: list[tuple[str, CommitInfo]] = []
+    current_size = 0
+    for repo_name, commit in commits:
+        size = len(commit.diff) + len(commit.body) + len(commit.subject) + 200
+        if current and current_size + size > max_chars:
+            chunks.append(current)
+            current = []
+            current_size = 0
+        current.append((repo_name, commit))
+        current_size += size
+    if current:
+        chunks.append(current)
+    return chunks
 
 
 def run_research_stage(
@@ -973,6 +1264,7 @@ def run_research_stage(
         return (
             "# Research: No Commits Found\n\nNo commits were found in the specified period.",
             cost_tracker,
+            False,
         )
 
     # Build the prompt
@@ -982,44 +1274,72 @@ def run_research_stage(
     if description:
         description_section = f"\n# Description\n{description}\n"
 
-    user_prompt = f"""# Blog Post Topic
+    def build_user_prompt(text: str) -> str:
+        return f"""# Blog Post Topic
 {topic}
 {description_section}
 # Time Period
 {start_date} to {end_date}
 
-{commits_text}
+{text}
 
 Please analyze these commits and identify changes relevant to the blog post topic."""
 
+    user_prompt = build_user_prompt(commits_text)
+
     # Build system prompt with context
-    system_prompt = RESEARCH_SYSTEM_PROMPT
-    if global_context or client_context:
-        system_prompt += "\n\n---\n\nContext:\n"
-        if global_context:
-            system_prompt += f"\nCompany Background:\n{global_context}\n"
-        if client_context:
-            system_prompt += f"\nClient Context:\n{client_context}\n"
+    system_prompt = _build_system_prompt(RESEARCH_SYSTEM_PROMPT, global_context, client_context)
 
     if dry_run:
         print(f"[DRY RUN] Would send {len(user_prompt)} chars to LLM", file=sys.stderr)
         research_content = f"*(Dry run - {len(commits)} commits would be analyzed)*"
-        no_relevant_changes = False
-    else:
+    elif len(commits_text) <= _RESEARCH_CHUNK_CHARS:
         print("Calling LLM for research analysis...", file=sys.stderr)
         research_content = call_llm(
             model, system_prompt, user_prompt, temperature, cost_tracker, max_cost
         )
         print(f"Research complete (cost: ${cost_tracker.total_cost:.4f})", file=sys.stderr)
+    else:
+        # Map-reduce: analyze token-budgeted chunks of commits concurrently,
+        # then merge the partial analyses with one further call. One giant
+        # prompt is slower than N shorter parallel ones and can overflow the
+        # model's context for busy periods.
+        chunks = _chunk_commits(commits, _RESEARCH_CHUNK_CHARS)
+        print(
+            f"Commit set is large; analyzing {len(chunks)} chunks in parallel...",
+            file=sys.stderr,
+        )
+        chunk_prompts = [build_user_prompt(format_commits_for_prompt(c)) for c in chunks]
+        partials = call_llm_parallel(
+            model, system_prompt, chunk_prompts, temperature, cost_tracker, max_cost
+        )
 
-        # Check if LLM found no relevant changes
-        no_relevant_changes = bool(
-            re.search(
-                r"^##\s*No Relevant Changes Found", research_content, re.MULTILINE | re.IGNORECASE
-            )
+        batches = "\n\n---\n\n".join(
+            f"## Batch {i} analysis\n\n{partial}" for i, partial in enumerate(partials, 1)
         )
-        if no_relevant_changes:
-            print("LLM found no relevant changes for the topic.", file=sys.stderr)
+        merge_prompt = f"""# Blog Post Topic
+{topic}
+{description_section}
+# Time Period
+{start_date} to {end_date}
+
+The commit history was analyzed in {len(chunks)} batches. Merge the batch analyses below into a single research summary in the usual format. Combine overlapping findings, drop duplicates, and keep every commit reference that supports a relevant change. If no batch found relevant changes, output the "## No Relevant Changes Found" section.
+
+{batches}"""
+        print("Merging chunk analyses...", file=sys.stderr)
+        research_content = call_llm(
+            model, system_prompt, merge_prompt, temperature, cost_tracker, max_cost
+        )
+        print(f"Research complete (cost: ${cost_tracker.total_cost:.4f})", file=sys.stderr)
+
+    # Check if LLM found no relevant changes
+    no_relevant_changes = bool(
+        re.search(
+            r"^##\s*No Relevant Changes Found", research_content, re.MULTILINE | re.IGNORECASE
+        )
+    )
+    if no_relevant_changes:
+        print("LLM found no relevant changes for the topic.", file=sys.stderr)
 
     # Extract commit references from the LLM output
     extracted_refs = extract_commit_shas_from_research(research_content)
@@ -1051,6 +1371,9 @@ def run_write_stage(
     global_context: str = "",
     client_context: str = "",
     dry_run: bool = False,
+    research_content: Optional[str] = None,
+    metadata: Optional[ResearchMetadata] = None,
+    output_stream: Optional[TextIO] = None,
 ) -> tuple[str, CostTracker]:
     """Runs the write stage of blog post generation.
 
@@ -1063,19 +1386,26 @@ def run_write_stage(
         global_context: Company context for prompt.
         client_context: Client-specific context for prompt.
         dry_run: If True, don't call LLM.
+        research_content: Research file contents, if the caller already read
+            them; avoids re-reading the file.
+        metadata: Parsed metadata, if the caller already parsed it.
+        output_stream: If provided, stream the blog post to this stream as
+            it is generated.
 
     Returns:
         Tuple of (blog_post_markdown, cost_tracker).
     """
     cost_tracker = CostTracker()
 
-    # Read research file
-    print(f"Reading research from: {research_path}", file=sys.stderr)
-    with open(research_path) as f:
-        research_content = f.read()
+    # Read research file unless the caller handed us its contents
+    if research_content is None:
+        print(f"Reading research from: {research_path}", file=sys.stderr)
+        with open(research_path) as f:
+            research_content = f.read()
+
+    if metadata is None:
+        metadata = parse_research_metadata(research_content)
 
-    # Parse metadata
-    metadata = parse_research_metadata(research_content)
     if not metadata:
         print("Warning: No metadata found in research file, using defaults", file=sys.stderr)
         metadata = ResearchMetadata(
@@ -1085,7 +1415,7 @@ def run_write_stage(
             period="",
             client="",
             author="",
-            root=os.path.dirname(os.getcwd()),
+            root=_default_root(),
             commits=[],
         )
 
@@ -1108,7 +1438,7 @@ def run_write_stage(
     key_files_text = ""
     if key_file_refs:
         print(f"Retrieving {len(key_file_refs)} key files...", file=sys.stderr)
-        root = metadata.root or os.path.dirname(os.getcwd())
+        root = metadata.root or _default_root()
         period = metadata.period if metadata else ""
         key_files = retrieve_key_files(root, key_file_refs, period=period, max_lines=500)
         print(f"Retrieved {len(key_files)} key files", file=sys.stderr)
@@ -1147,13 +1477,7 @@ def run_write_stage(
 Write a blog post based on this material. Use the KEY FILES above for code examples (they show the final implementation). Use the commit diffs for context on design decisions, but focus on the end result, not the changes."""
 
     # Build system prompt with context
-    system_prompt = WRITE_SYSTEM_PROMPT
-    if global_context or client_context:
-        system_prompt += "\n\n---\n\nContext:\n"
-        if global_context:
-            system_prompt += f"\nCompany Background:\n{global_context}\n"
-        if client_context:
-            system_prompt += f"\nClient Context:\n{client_context}\n"
+    system_prompt = _build_system_prompt(WRITE_SYSTEM_PROMPT, global_context, client_context)
 
     if dry_run:
         print(f"[DRY RUN] Would send {len(user_prompt)} chars to LLM", file=sys.stderr)
@@ -1161,7 +1485,13 @@ Write a blog post based on this material. Use the KEY FILES above for code examp
     else:
         print("Calling LLM to write blog post...", file=sys.stderr)
         blog_content = call_llm(
-            model, system_prompt, user_prompt, temperature, cost_tracker, max_cost
+            model,
+            system_prompt,
+            user_prompt,
+            temperature,
+            cost_tracker,
+            max_cost,
+            output_stream=output_stream,
         )
         print(f"Writing complete (cost: ${cost_tracker.total_cost:.4f})", file=sys.stderr)
 
@@ -1285,13 +1615,7 @@ def run_review_stage(
 Please produce a refined version of the blog post that addresses this feedback."""
 
     # Build system prompt with context
-    system_prompt = REVIEW_SYSTEM_PROMPT
-    if global_context or client_context:
-        system_prompt += "\n\n---\n\nContext:\n"
-        if global_context:
-            system_prompt += f"\nCompany Background:\n{global_context}\n"
-        if client_context:
-            system_prompt += f"\nClient Context:\n{client_context}\n"
+    system_prompt = _build_system_prompt(REVIEW_SYSTEM_PROMPT, global_context, client_context)
 
     if dry_run:
         print(f"[DRY RUN] Would send {len(user_prompt)} chars to LLM", file=sys.stderr)
@@ -1336,6 +1660,16 @@ def add_common_args(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="Write output to stdout instead of file.",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run stages even if cached outputs match the same inputs.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write stage cache sidecar files.",
+    )
     add_config_arg(parser)
 
 
@@ -1383,6 +1717,146 @@ def add_research_args(parser: argparse.ArgumentParser) -> None:
     add_fetch_arg(parser)
 
 
+@functools.lru_cache(maxsize=1)
+def _default_root() -> str:
+    """Fallback repositories root (parent of cwd) when none is recorded.
+
+    Returns:
+        Absolute path used when metadata or arguments carry no root.
+    """
+    return os.path.dirname(os.getcwd())
+
+
+@functools.cache
+def _ensure_dir(path: str) -> str:
+    """Creates a directory (with parents) once per process.
+
+    Memoized so repeated writes into the same output directory skip the
+    per-component stat calls os.makedirs performs.
+
+    Args:
+        path: Directory to create; empty means the current directory.
+
+    Returns:
+        The path, unchanged.
+    """
+    os.makedirs(path or ".", exist_ok=True)
+    return path
+
+
+def _stage_hash(*parts: object) -> str:
+    """Hashes stage inputs into a short cache key.
+
+    Args:
+        *parts: JSON-serializable values identifying the stage inputs.
+
+    Returns:
+        Hex digest identifying this combination of inputs.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _read_cached_stage(path: str, key: str) -> Optional[str]:
+    """Returns a cached stage output if its sidecar hash matches.
+
+    Args:
+        path: Stage output file (e.g. research.md).
+        key: Expected input hash.
+
+    Returns:
+        The cached file contents, or None on any miss.
+    """
+    try:
+        if Path(path + ".hash").read_text(encoding="utf-8").strip() != key:
+            return None
+        return Path(path).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _store_stage_hash(path: str, key: str) -> None:
+    """Records the input hash for a freshly written stage output.
+
+    Args:
+        path: Stage output file the hash describes.
+        key: Input hash to record in the sidecar file.
+    """
+    with contextlib.suppress(OSError):
+        Path(path + ".hash").write_text(key + "\n", encoding="utf-8")
+
+
+def _resolve_output_dir(output: Optional[str], topic: str) -> Path:
+    """Resolves the directory that receives generated blog files.
+
+    Returns early for an explicit output path, so the topic slug and the
+    get_output_dir import only happen on the default-path fallback.
+
+    Args:
+        output: Explicit output file or directory path, if given.
+        topic: Blog post topic; derives the default directory slug.
+
+    Returns:
+        Directory path (not yet created).
+    """
+    if output:
+        out = Path(output)
+        if output.endswith("/") or out.is_dir():
+            return out
+        return out.parent
+
+    from code_recap.paths import get_output_dir
+
+    slug = _SLUG_RE.sub("-", topic.lower())[:50]
+    return get_output_dir(subdir=f"blog/{slug}")
+
+
+def _write_output_file(path: str, text: str) -> None:
+    """Writes a generated document to disk in a single unbuffered write.
+
+    These are one-shot whole-file writes, so encoding once and issuing a
+    single os.write skips the TextIOWrapper buffering layer entirely.
+
+    Args:
+        path: Destination file path.
+        text: File contents.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, text.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def _filter_repos(repos: list[str], patterns: Sequence[str]) -> list[str]:
+    """Filters repositories by name against glob or substring patterns.
+
+    Wildcard-free patterns are checked as plain case-insensitive substrings;
+    the rest are compiled into a single union regex of their fnmatch
+    translations, so each repo name is scanned once instead of once per
+    pattern.
+
+    Args:
+        repos: Repository paths to filter.
+        patterns: Glob patterns; each also matches as a plain
+            case-insensitive substring of the repo name.
+
+    Returns:
+        Repositories whose basename matches any pattern, in input order.
+    """
+    import fnmatch
+
+    literals = [p.lower() for p in patterns if not any(c in p for c in "*?[")]
+    globs = [p for p in patterns if any(c in p for c in "*?[")]
+    glob_re = re.compile("|".join(fnmatch.translate(p.lower()) for p in globs)) if globs else None
+    kept = []
+    for repo in repos:
+        name = os.path.basename(repo).lower()
+        if (glob_re and glob_re.match(name)) or any(lit in name for lit in literals):
+            kept.append(repo)
+    return kept
+
+
 def cmd_research(args: argparse.Namespace) -> int:
     """Handles the 'research' subcommand.
 
@@ -1435,19 +1909,7 @@ def cmd_research(args: argparse.Namespace) -> int:
 
     # Additional filter patterns
     if args.filter:
-        import fnmatch
-
-        filtered = []
-        for repo in repos:
-            repo_name = os.path.basename(repo)
-            for pattern in args.filter:
-                if (
-                    fnmatch.fnmatch(repo_name.lower(), pattern.lower())
-                    or pattern.lower() in repo_name.lower()
-                ):
-                    filtered.append(repo)
-                    break
-        repos = filtered
+        repos = _filter_repos(repos, args.filter)
         if not repos:
             print("No repositories matched filter(s)", file=sys.stderr)
             return 1
@@ -1457,7 +1919,9 @@ def cmd_research(args: argparse.Namespace) -> int:
 
     # Fetch repos if requested
     if args.fetch:
-        fetch_repos_with_progress(repos, include_submodules=True, output=sys.stderr)
+        fetch_repos_with_progress(
+            repos, include_submodules=True, max_workers=args.fetch_jobs, output=sys.stderr
+        )
 
     # Run research stage
     output, cost_tracker, no_relevant_changes = run_research_stage(
@@ -1491,7 +1955,7 @@ def cmd_research(args: argparse.Namespace) -> int:
     if args.stdout:
         print(output)
     elif args.output:
-        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        _ensure_dir(os.path.dirname(args.output))
         with open(args.output, "w") as f:
             f.write(output)
         print(f"Research written to: {args.output}", file=sys.stderr)
@@ -1499,10 +1963,9 @@ def cmd_research(args: argparse.Namespace) -> int:
         # Default output path
         from code_recap.paths import get_output_dir
 
-        slug = re.sub(r"[^\w\-]", "-", topic.lower())[:50]
-        output_dir_path = get_output_dir(subdir=f"blog/{slug}")
-        os.makedirs(output_dir_path, exist_ok=True)
-        output_path = os.path.join(str(output_dir_path), "research.md")
+        slug = _SLUG_RE.sub("-", topic.lower())[:50]
+        output_dir_path = _ensure_dir(str(get_output_dir(subdir=f"blog/{slug}")))
+        output_path = os.path.join(output_dir_path, "research.md")
         with open(output_path, "w") as f:
             f.write(output)
         print(f"Research written to: {output_path}", file=sys.stderr)
@@ -1552,13 +2015,15 @@ def cmd_write(args: argparse.Namespace) -> int:
         global_context=global_context,
         client_context=client_context,
         dry_run=args.dry_run,
+        research_content=content,
+        metadata=metadata,
     )
 
     # Write output
     if args.stdout:
         print(output)
     elif args.output:
-        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        _ensure_dir(os.path.dirname(args.output))
         with open(args.output, "w") as f:
             f.write(output)
         print(f"Blog post written to: {args.output}", file=sys.stderr)
@@ -1643,7 +2108,7 @@ def cmd_review(args: argparse.Namespace) -> int:
     if args.stdout:
         print(output)
     elif args.output:
-        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        _ensure_dir(os.path.dirname(args.output))
         with open(args.output, "w") as f:
             f.write(output)
         print(f"Refined post written to: {args.output}", file=sys.stderr)
@@ -1658,6 +2123,16 @@ def cmd_review(args: argparse.Namespace) -> int:
     return 0
 
 
+def _warm_litellm() -> None:
+    """Imports litellm so the first call_llm finds it in sys.modules.
+
+    The cold import loads pydantic and litellm's provider tables, which
+    takes long enough to be worth overlapping with git work.
+    """
+    with contextlib.suppress(ImportError):
+        import litellm  # noqa: F401  # pyright: ignore[reportMissingImports]
+
+
 def cmd_full(args: argparse.Namespace) -> int:
     """Handles the 'full' subcommand (research + write).
 
@@ -1669,6 +2144,12 @@ def cmd_full(args: argparse.Namespace) -> int:
     """
     resolve_author(args)
 
+    # Warm the litellm import in the background while repository discovery,
+    # fetching, and commit gathering run; it is off the critical path until
+    # the first research LLM call.
+    if not args.dry_run:
+        threading.Thread(target=_warm_litellm, daemon=True).start()
+
     # Read topic from stdin if '-'
     if args.topic == "-":
         topic = sys.stdin.read().strip()
@@ -1709,19 +2190,7 @@ def cmd_full(args: argparse.Namespace) -> int:
 
     # Additional filter patterns
     if args.filter:
-        import fnmatch
-
-        filtered = []
-        for repo in repos:
-            repo_name = os.path.basename(repo)
-            for pattern in args.filter:
-                if (
-                    fnmatch.fnmatch(repo_name.lower(), pattern.lower())
-                    or pattern.lower() in repo_name.lower()
-                ):
-                    filtered.append(repo)
-                    break
-        repos = filtered
+        repos = _filter_repos(repos, args.filter)
         if not repos:
             print("No repositories matched filter(s)", file=sys.stderr)
             return 1
@@ -1731,91 +2200,149 @@ def cmd_full(args: argparse.Namespace) -> int:
 
     # Fetch repos if requested
     if args.fetch:
-        fetch_repos_with_progress(repos, include_submodules=True, output=sys.stderr)
+        fetch_repos_with_progress(
+            repos, include_submodules=True, max_workers=args.fetch_jobs, output=sys.stderr
+        )
 
     # Determine output paths
-    if args.output:
-        if os.path.isdir(args.output) or args.output.endswith("/"):
-            output_dir = args.output
-        else:
-            output_dir = os.path.dirname(args.output) or "."
-    else:
-        from code_recap.paths import get_output_dir
-
-        slug = re.sub(r"[^\w\-]", "-", topic.lower())[:50]
-        output_dir = str(get_output_dir(subdir=f"blog/{slug}"))
-
-    os.makedirs(output_dir, exist_ok=True)
-    research_path = os.path.join(output_dir, "research.md")
-    post_path = os.path.join(output_dir, "post.md")
+    output_dir = _resolve_output_dir(args.output, topic)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    research_path = str(output_dir / "research.md")
+    post_path = str(output_dir / "post.md")
 
     total_cost = CostTracker()
+    use_cache = not args.no_cache and not args.dry_run
 
     # Stage 1: Research
     print_heading("Stage 1: Research")
 
-    research_output, research_cost, no_relevant_changes = run_research_stage(
-        topic=topic,
-        repos=repos,
-        start_date=start_date,
-        end_date=end_date,
-        author=args.author,
-        period_str=args.period,
-        client=args.client or "",
-        root=root,
-        model=args.model,
-        temperature=args.temperature,
-        max_cost=args.max_cost,
-        max_diff_lines=args.max_diff_lines,
-        description=args.description or "",
-        instructions=args.instructions or "",
-        global_context=global_context,
-        client_context=client_context,
-        dry_run=args.dry_run,
+    research_key = _stage_hash(
+        "research",
+        topic,
+        repos,
+        start_date,
+        end_date,
+        args.author,
+        args.period,
+        args.client or "",
+        root,
+        args.model,
+        args.temperature,
+        args.max_diff_lines,
+        args.description or "",
+        args.instructions or "",
+        global_context,
+        client_context,
     )
 
-    total_cost.total_input_tokens += research_cost.total_input_tokens
-    total_cost.total_output_tokens += research_cost.total_output_tokens
-    total_cost.total_cost += research_cost.total_cost
-    total_cost.calls += research_cost.calls
+    research_output = None
+    if use_cache and not args.force:
+        research_output = _read_cached_stage(research_path, research_key)
 
-    # Fail if no relevant changes found
-    if no_relevant_changes:
-        print(f"\nTotal cost: {total_cost.summary()}", file=sys.stderr)
-        print(f"Error: No relevant changes found for topic: {topic}", file=sys.stderr)
-        return 1
+    if research_output is not None:
+        print(f"Using cached research: {research_path}", file=sys.stderr)
+    else:
+        research_output, research_cost, no_relevant_changes = run_research_stage(
+            topic=topic,
+            repos=repos,
+            start_date=start_date,
+            end_date=end_date,
+            author=args.author,
+            period_str=args.period,
+            client=args.client or "",
+            root=root,
+            model=args.model,
+            temperature=args.temperature,
+            max_cost=args.max_cost,
+            max_diff_lines=args.max_diff_lines,
+            description=args.description or "",
+            instructions=args.instructions or "",
+            global_context=global_context,
+            client_context=client_context,
+            dry_run=args.dry_run,
+        )
+
+        total_cost += research_cost
 
-    # Save research
-    with open(research_path, "w") as f:
-        f.write(research_output)
-    print(f"Research written to: {research_path}", file=sys.stderr)
+        # Fail if no relevant changes found
+        if no_relevant_changes:
+            print(f"\nTotal cost: {total_cost.summary()}", file=sys.stderr)
+            print(f"Error: No relevant changes found for topic: {topic}", file=sys.stderr)
+            return 1
+
+        # Save research
+        _write_output_file(research_path, research_output)
+        if use_cache:
+            _store_stage_hash(research_path, research_key)
+        print(f"Research written to: {research_path}", file=sys.stderr)
 
     # Stage 2: Write
     print("", file=sys.stderr)
     print_heading("Stage 2: Write")
 
-    blog_output, write_cost = run_write_stage(
-        research_path=research_path,
-        model=args.model,
-        temperature=args.temperature,
-        max_cost=args.max_cost - total_cost.total_cost,  # Remaining budget
-        max_diff_lines=args.max_diff_lines,
-        global_context=global_context,
-        client_context=client_context,
-        dry_run=args.dry_run,
+    # The write stage depends on the research content itself, not the
+    # research inputs, so hand-edited research re-triggers a write.
+    write_key = _stage_hash(
+        "write",
+        research_output,
+        args.model,
+        args.temperature,
+        args.max_diff_lines,
+        global_context,
+        client_context,
     )
 
-    total_cost.total_input_tokens += write_cost.total_input_tokens
-    total_cost.total_output_tokens += write_cost.total_output_tokens
-    total_cost.total_cost += write_cost.total_cost
-    total_cost.calls += write_cost.calls
+    blog_output = None
+    post_stream: Optional[TextIO] = None
+    if use_cache and not args.force:
+        blog_output = _read_cached_stage(post_path, write_key)
+    post_cached = blog_output is not None
 
-    # Save blog post
+    if post_cached:
+        print(f"Using cached blog post: {post_path}", file=sys.stderr)
+    else:
+        # Stream the post to a temp file so it can be tailed while the LLM
+        # is still generating, then rename into place on success — a failed
+        # write stage must not clobber an existing post.md (stdout and
+        # dry-run modes keep the buffered path).
+        post_tmp = post_path + ".tmp"
+        if not args.stdout and not args.dry_run:
+            # Deliberately long-lived: closed in the handlers below so the
+            # stream spans the whole write stage.
+            post_stream = open(post_tmp, "w", encoding="utf-8")  # noqa: SIM115
+        try:
+            blog_output, write_cost = run_write_stage(
+                research_path=research_path,
+                research_content=research_output,
+                model=args.model,
+                temperature=args.temperature,
+                max_cost=args.max_cost - total_cost.total_cost,  # Remaining budget
+                max_diff_lines=args.max_diff_lines,
+                global_context=global_context,
+                client_context=client_context,
+                dry_run=args.dry_run,
+                output_stream=post_stream,
+            )
+        except BaseException:
+            if post_stream is not None:
+                post_stream.close()
+                with contextlib.suppress(OSError):
+                    os.unlink(post_tmp)
+            raise
+        if post_stream is not None:
+            post_stream.close()
+            os.replace(post_tmp, post_path)
+
+        total_cost += write_cost
+
+    # Save blog post (already on disk when it was streamed or cached)
     if args.stdout:
         print(blog_output)
-    else:
-        with open(post_path, "w") as f:
-            f.write(blog_output)
+    elif not post_cached:
+        if post_stream is None:
+            _write_output_file(post_path, blog_output)
+        if use_cache:
+            _store_stage_hash(post_path, write_key)
         print(f"Blog post written to: {post_path}", file=sys.stderr)
 
     print("", file=sys.stderr)
@@ -1832,9 +2359,8 @@ def cmd_list_models(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success).
     """
-    try:
-        import litellm
-    except ImportError:
+    model_cost = _get_model_cost_table()
+    if model_cost is None:
         print("litellm not installed. Install with: pip install litellm", file=sys.stderr)
         return 1
 
@@ -1851,58 +2377,24 @@ def cmd_list_models(args: argparse.Namespace) -> int:
     for prov in providers_to_show:
         print(f"=== {prov.upper()} ===")
         for model, description in RECOMMENDED_MODELS[prov]:
+            cost = model_cost.get(model)
             cost_info = ""
-            try:
-                if model in litellm.model_cost:
-                    cost = litellm.model_cost[model]
-                    input_cost = cost.get("input_cost_per_token", 0) * 1_000_000
-                    output_cost = cost.get("output_cost_per_token", 0) * 1_000_000
-                    cost_info = f" [${input_cost:.2f}/${output_cost:.2f} per 1M]"
-            except Exception:
-                pass
+            if cost:
+                input_cost = (cost.get("input_cost_per_token") or 0) * 1_000_000
+                output_cost = (cost.get("output_cost_per_token") or 0) * 1_000_000
+                cost_info = f" [${input_cost:.2f}/${output_cost:.2f} per 1M]"
             print(f"  {model:<42} {description}{cost_info}")
         print()
 
     return 0
 
 
-def main(argv: Optional[list[str]] = None) -> int:
-    """Entry point for the CLI tool.
+def _add_research_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Registers the 'research' subparser.
 
     Args:
-        argv: Command-line arguments (defaults to sys.argv[1:]).
-
-    Returns:
-        Process exit code.
+        subparsers: Subparsers action to register on.
     """
-    parser = argparse.ArgumentParser(
-        description="Generate blog posts from git activity using a two-stage LLM pipeline.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Stage 1: Research (uses git config user.name by default)
-  %(prog)s research "Building a Real-Time LED Controller" --period 2025-09
-
-  # With description for research context
-  %(prog)s research "AccessorySetupKit Integration" --period 2025-08 \\
-    -d "Focus on how we implemented Apple's AccessorySetupKit for seamless BLE pairing"
-
-  # With writing instructions
-  %(prog)s research "AccessorySetupKit Integration" --period 2025-08 \\
-    -i "Write for a non-technical audience, focus on user benefits"
-
-  # Stage 2: Write (after reviewing/editing research)
-  %(prog)s write output/blog/building-a-real-time-led-controller/research.md
-
-  # Combined: Run both stages
-  %(prog)s full "Building a Real-Time LED Controller" --period 2025-09 \\
-    -i "Technical deep-dive for iOS developers"
-        """,
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
-
-    # Research subcommand
     research_parser = subparsers.add_parser(
         "research",
         help="Stage 1: Analyze git activity and create research summary",
@@ -1911,7 +2403,13 @@ Examples:
     add_research_args(research_parser)
     add_common_args(research_parser)
 
-    # Write subcommand
+
+def _add_write_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Registers the 'write' subparser.
+
+    Args:
+        subparsers: Subparsers action to register on.
+    """
     write_parser = subparsers.add_parser(
         "write",
         help="Stage 2: Generate blog post from research summary",
@@ -1929,7 +2427,13 @@ Examples:
     )
     add_common_args(write_parser)
 
-    # Full subcommand
+
+def _add_full_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Registers the 'full' subparser.
+
+    Args:
+        subparsers: Subparsers action to register on.
+    """
     full_parser = subparsers.add_parser(
         "full",
         help="Run both stages sequentially",
@@ -1938,7 +2442,13 @@ Examples:
     add_research_args(full_parser)
     add_common_args(full_parser)
 
-    # Review subcommand
+
+def _add_review_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Registers the 'review' subparser.
+
+    Args:
+        subparsers: Subparsers action to register on.
+    """
     review_parser = subparsers.add_parser(
         "review",
         help="Refine a blog post draft with feedback",
@@ -1963,7 +2473,13 @@ Examples:
     )
     add_common_args(review_parser)
 
-    # List models subcommand
+
+def _add_list_models_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Registers the 'list-models' subparser.
+
+    Args:
+        subparsers: Subparsers action to register on.
+    """
     models_parser = subparsers.add_parser(
         "list-models",
         help="List available LLM models",
@@ -1974,24 +2490,95 @@ Examples:
         help="Filter by provider (openai, anthropic, gemini).",
     )
 
+
+_SUBCOMMAND_BUILDERS = {
+    "research": _add_research_parser,
+    "write": _add_write_parser,
+    "full": _add_full_parser,
+    "review": _add_review_parser,
+    "list-models": _add_list_models_parser,
+}
+
+_DISPATCH = {
+    "research": cmd_research,
+    "write": cmd_write,
+    "full": cmd_full,
+    "review": cmd_review,
+    "list-models": cmd_list_models,
+}
+
+
+def _build_parser(only: Optional[str] = None) -> argparse.ArgumentParser:
+    """Builds the CLI argument parser.
+
+    Args:
+        only: If given, construct just this subcommand's subparser instead
+            of all five; keeps startup cheap when the subcommand is already
+            known from argv.
+
+    Returns:
+        Configured argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate blog posts from git activity using a two-stage LLM pipeline.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Stage 1: Research (uses git config user.name by default)
+  %(prog)s research "Building a Real-Time LED Controller" --period 2025-09
+
+  # With description for research context
+  %(prog)s research "AccessorySetupKit Integration" --period 2025-08 \\
+    -d "Focus on how we implemented Apple's AccessorySetupKit for seamless BLE pairing"
+
+  # With writing instructions
+  %(prog)s research "AccessorySetupKit Integration" --period 2025-08 \\
+    -i "Write for a non-technical audience, focus on user benefits"
+
+  # Stage 2: Write (after reviewing/editing research)
+  %(prog)s write output/blog/building-a-real-time-led-controller/research.md
+
+  # Combined: Run both stages
+  %(prog)s full "Building a Real-Time LED Controller" --period 2025-09 \\
+    -i "Technical deep-dive for iOS developers"
+        """,
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    for name, build in _SUBCOMMAND_BUILDERS.items():
+        if only is None or name == only:
+            build(subparsers)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Entry point for the CLI tool.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        Process exit code.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Build only the requested subparser when the first argument names a
+    # known subcommand; help, no-args and unknown-command paths still get
+    # the full parser.
+    first = argv[0] if argv else None
+    only = first if first in _SUBCOMMAND_BUILDERS else None
+    parser = _build_parser(only)
+
     args = parser.parse_args(argv)
 
     if args.command is None:
         parser.print_help()
         return 1
 
-    if args.command == "research":
-        return cmd_research(args)
-    elif args.command == "write":
-        return cmd_write(args)
-    elif args.command == "full":
-        return cmd_full(args)
-    elif args.command == "review":
-        return cmd_review(args)
-    elif args.command == "list-models":
-        return cmd_list_models(args)
-
-    return 1
+    handler = _DISPATCH.get(args.command)
+    return handler(args) if handler else 1
 
 
 if __name__ == "__main__":
@@ -1560,7 +1560,7 @@ Examples:
         _, fetch_success = fetch_repos_with_progress(
             repos,
             include_submodules=True,
-            max_workers=8,
+            max_workers=args.fetch_jobs,
             error_on_failure=args.error_on_fetch_failure,
             output=sys.stderr,
         )
@@ -6,6 +6,7 @@ including running git commands, detecting repositories, discovering
 submodules, and fetching updates.
 """
 
+import functools
 import os
 import subprocess
 import sys
@@ -18,12 +19,16 @@ from typing import Callable, Optional
 from code_recap.paths import get_default_scan_root
 
 
-def run_git(repo_path: str, args: Sequence[str]) -> tuple[int, str, str]:
+def run_git(
+    repo_path: str, args: Sequence[str], input_text: Optional[str] = None
+) -> tuple[int, str, str]:
     """Runs a git command in the provided repository path.
 
     Args:
         repo_path: Absolute path to the git repository directory to use as CWD.
         args: Sequence of git arguments (without the leading "git").
+        input_text: Optional text to feed to the command's stdin (for
+            batch-oriented commands such as `git log --stdin`).
 
     Returns:
         A tuple of (return_code, stdout_text, stderr_text).
@@ -31,16 +36,62 @@ def run_git(repo_path: str, args: Sequence[str]) -> tuple[int, str, str]:
     proc = subprocess.Popen(
         ["git", *args],
         cwd=repo_path,
+        stdin=subprocess.PIPE if input_text is not None else None,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
     )
-    out_bytes, err_bytes = proc.communicate()
+    out_bytes, err_bytes = proc.communicate(
+        input=input_text.encode() if input_text is not None else None
+    )
     # Decode with 'replace' to handle non-UTF-8 bytes (e.g., in binary diffs)
     out = out_bytes.decode("utf-8", errors="replace")
     err = err_bytes.decode("utf-8", errors="replace")
     return proc.returncode, out, err
 
 
+def run_git_truncated(repo_path: str, args: Sequence[str], max_lines: int) -> tuple[int, str, bool]:
+    """Runs a git command, keeping at most `max_lines` of its output.
+
+    Reads the pipe incrementally and stops consuming once the limit is
+    reached, so commands with huge output (e.g. `git show` on large refactor
+    commits) never materialize megabytes of text just to be discarded.
+
+    Args:
+        repo_path: Absolute path to the git repository directory to use as CWD.
+        args: Sequence of git arguments (without the leading "git").
+        max_lines: Maximum number of output lines to keep.
+
+    Returns:
+        A tuple of (return_code, stdout_text, truncated). When truncated is
+        True the command was killed early and return_code is reported as 0,
+        since producing `max_lines` of output means it was running normally.
+    """
+    proc = subprocess.Popen(
+        ["git", *args],
+        cwd=repo_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    assert proc.stdout is not None
+    # Accumulate raw bytes and decode once at the end: UTF-8 continuation
+    # bytes never contain b"\n", so splitting lines before decoding is safe,
+    # and a single decode is much cheaper than decoding per line.
+    lines: list[bytes] = []
+    truncated = False
+    for line in proc.stdout:
+        # Only the arrival of a line past the limit proves truncation;
+        # output of exactly max_lines passes through unmarked.
+        if len(lines) >= max_lines:
+            truncated = True
+            break
+        lines.append(line)
+    if truncated:
+        proc.terminate()
+    proc.stdout.close()
+    code = proc.wait()
+    return (0 if truncated else code), b"".join(lines).decode("utf-8", errors="replace"), truncated
+
+
 def get_git_config_author() -> Optional[str]:
     """Gets the default author name from git config.
 
@@ -103,41 +154,50 @@ def discover_top_level_repos(
     """
     repos: list[str] = []
     try:
-        for entry in sorted(os.listdir(root)):
-            if entry.startswith("."):
-                continue
-            # Skip archive directory unless explicitly requested
-            if not include_archived and entry == archive_dir:
-                continue
-            full = os.path.join(root, entry)
-            if os.path.isdir(full) and is_git_repo(full):
-                repos.append(full)
+        with os.scandir(root) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.name.startswith("."):
+                    continue
+                # Skip archive directory unless explicitly requested
+                if not include_archived and entry.name == archive_dir:
+                    continue
+                # Real directories resolve from the scandir cache with no
+                # extra stat; symlinked repos need the follow-link check.
+                if not entry.is_dir(follow_symlinks=False) and not (
+                    entry.is_symlink() and entry.is_dir()
+                ):
+                    continue
+                if os.path.exists(os.path.join(entry.path, ".git")) or is_git_repo(entry.path):
+                    repos.append(entry.path)
     except FileNotFoundError as exc:
         raise SystemExit(f"Root directory not found: {root}") from exc
     return repos
 
 
-def discover_submodules(repo_path: str) -> list[str]:
-    """Discovers submodule directories inside a git repository if present.
+@functools.lru_cache(maxsize=1024)
+def _parse_submodules(repo_path: str, gitmodules_mtime_ns: int) -> tuple[str, ...]:
+    """Parses and validates .gitmodules entries for a repository.
+
+    Cached on (repo_path, .gitmodules mtime): fetching, period gathering and
+    commit retrieval all re-walk submodules, and each parse costs a git
+    subprocess. An edited .gitmodules changes the mtime and so naturally
+    invalidates the cached entry.
 
     Args:
         repo_path: Absolute path to the root of the git repository.
+        gitmodules_mtime_ns: st_mtime_ns of the repo's .gitmodules file.
 
     Returns:
-        List of absolute paths to submodule directories. If no submodules are
-        present, returns an empty list.
+        Tuple of absolute paths to submodule directories.
     """
-    gitmodules_path = os.path.join(repo_path, ".gitmodules")
-    if not os.path.isfile(gitmodules_path):
-        return []
-
+    del gitmodules_mtime_ns  # part of the cache key only
     # Use git config to parse .gitmodules reliably
     code, out, _ = run_git(
         repo_path,
         ["config", "-f", ".gitmodules", "--get-regexp", "path"],
     )
     if code != 0:
-        return []
+        return ()
     submodule_paths: list[str] = []
     for line in out.splitlines():
         # Lines look like: submodule."path/to/sub".path path/to/sub
@@ -148,7 +208,25 @@ def discover_submodules(repo_path: str) -> list[str]:
         full_path = os.path.join(repo_path, path_rel)
         if os.path.isdir(full_path) and is_git_repo(full_path):
             submodule_paths.append(full_path)
-    return submodule_paths
+    return tuple(submodule_paths)
+
+
+def discover_submodules(repo_path: str) -> list[str]:
+    """Discovers submodule directories inside a git repository if present.
+
+    Args:
+        repo_path: Absolute path to the root of the git repository.
+
+    Returns:
+        List of absolute paths to submodule directories. If no submodules are
+        present, returns an empty list.
+    """
+    gitmodules_path = os.path.join(repo_path, ".gitmodules")
+    try:
+        mtime_ns = os.stat(gitmodules_path).st_mtime_ns
+    except OSError:
+        return []
+    return list(_parse_submodules(repo_path, mtime_ns))
 
 
 def discover_all_submodules(repo_path: str) -> list[str]:
@@ -217,6 +295,35 @@ class FetchResult:
     failures: list[tuple[str, str]]
 
 
+def _expand_repos_to_fetch(repos: list[str], include_submodules: bool) -> list[str]:
+    """Expands a repository list with submodules, deduplicated by real path.
+
+    Args:
+        repos: List of repository paths.
+        include_submodules: Whether to include each repo's submodules.
+
+    Returns:
+        Unique repository paths to fetch, in discovery order.
+    """
+    repos_to_fetch: list[str] = []
+    seen_paths: set[str] = set()
+
+    for repo_path in repos:
+        real_path = os.path.realpath(repo_path)
+        if real_path not in seen_paths:
+            repos_to_fetch.append(repo_path)
+            seen_paths.add(real_path)
+
+        if include_submodules:
+            for sub_path in discover_all_submodules(repo_path):
+                sub_real = os.path.realpath(sub_path)
+                if sub_real not in seen_paths:
+                    repos_to_fetch.append(sub_path)
+                    seen_paths.add(sub_real)
+
+    return repos_to_fetch
+
+
 def fetch_all_repos(
     repos: list[str],
     include_submodules: bool = True,
@@ -239,21 +346,7 @@ def fetch_all_repos(
         fetch fails, success will be False.
     """
     # Build list of unique repos to fetch
-    repos_to_fetch: list[str] = []
-    seen_paths: set[str] = set()
-
-    for repo_path in repos:
-        real_path = os.path.realpath(repo_path)
-        if real_path not in seen_paths:
-            repos_to_fetch.append(repo_path)
-            seen_paths.add(real_path)
-
-        if include_submodules:
-            for sub_path in discover_all_submodules(repo_path):
-                sub_real = os.path.realpath(sub_path)
-                if sub_real not in seen_paths:
-                    repos_to_fetch.append(sub_path)
-                    seen_paths.add(sub_real)
+    repos_to_fetch = _expand_repos_to_fetch(repos, include_submodules)
 
     if not repos_to_fetch:
         return FetchResult(0, 0, 0, []), True
@@ -330,22 +423,9 @@ def fetch_repos_with_progress(
 
     print("Discovering repositories to fetch...", file=output)
 
-    # Count repos first for progress display
-    repos_to_fetch: list[str] = []
-    seen_paths: set[str] = set()
-
-    for repo_path in repos:
-        real_path = os.path.realpath(repo_path)
-        if real_path not in seen_paths:
-            repos_to_fetch.append(repo_path)
-            seen_paths.add(real_path)
-
-        if include_submodules:
-            for sub_path in discover_all_submodules(repo_path):
-                sub_real = os.path.realpath(sub_path)
-                if sub_real not in seen_paths:
-                    repos_to_fetch.append(sub_path)
-                    seen_paths.add(sub_real)
+    # Expand submodules once here; the expanded list is handed straight to
+    # fetch_all_repos so discovery (a git subprocess per repo) is not redone.
+    repos_to_fetch = _expand_repos_to_fetch(repos, include_submodules)
 
     print(f"Fetching {len(repos_to_fetch)} repositories in parallel...", file=output)
 
@@ -375,8 +455,8 @@ def fetch_repos_with_progress(
                 print(f"  [{completed}/{total}] FAILED: {name}: {error}", file=output)
 
     result, success = fetch_all_repos(
-        repos,
-        include_submodules=include_submodules,
+        repos_to_fetch,
+        include_submodules=False,
         max_workers=max_workers,
         error_on_failure=error_on_failure,
         progress_callback=progress_callback,
@@ -468,14 +548,20 @@ def discover_top_level_directories(
     """
     dirs: list[tuple[str, bool]] = []
     try:
-        for entry in sorted(os.listdir(root)):
-            if entry.startswith("."):
-                continue
-            if entry == archive_dir:
-                continue
-            full = os.path.join(root, entry)
-            if os.path.isdir(full):
-                dirs.append((full, is_git_repo(full)))
+        with os.scandir(root) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.name.startswith("."):
+                    continue
+                if entry.name == archive_dir:
+                    continue
+                # Real directories resolve from the scandir cache with no
+                # extra stat; symlinked dirs need the follow-link check.
+                if not entry.is_dir(follow_symlinks=False) and not (
+                    entry.is_symlink() and entry.is_dir()
+                ):
+                    continue
+                has_git = os.path.exists(os.path.join(entry.path, ".git"))
+                dirs.append((entry.path, has_git or is_git_repo(entry.path)))
     except FileNotFoundError as exc:
         raise SystemExit(f"Root directory not found: {root}") from exc
     return dirs
@@ -777,16 +863,15 @@ def get_commits_with_diffs(
 
         # Get the diff for this specific commit
         diff_args = ["show", "--no-color", "--format=", "--stat", "--patch", sha]
-        diff_code, diff_out, _ = run_git(repo_path, diff_args)
+        diff_code, diff_out, diff_truncated = run_git_truncated(
+            repo_path, diff_args, max_diff_lines
+        )
 
         diff_content = ""
         if diff_code == 0:
-            diff_lines = diff_out.split("\n")
-            if len(diff_lines) > max_diff_lines:
-                diff_content = "\n".join(diff_lines[:max_diff_lines])
-                diff_content += f"\n... (truncated, {len(diff_lines) - max_diff_lines} more lines)"
-            else:
-                diff_content = diff_out
+            diff_content = diff_out
+            if diff_truncated:
+                diff_content += "... (truncated)"
 
         commits.append(
             CommitInfo(
@@ -159,6 +159,22 @@ def get_default_output_dir_name() -> str:
         return "output/"
 
 
+def get_cache_dir() -> Path:
+    """Gets the cache directory for code-recap.
+
+    Respects XDG_CACHE_HOME when set, defaulting to ~/.cache/code-recap.
+
+    Returns:
+        Path to the cache directory (may not exist).
+    """
+    import os
+
+    base = os.environ.get("XDG_CACHE_HOME")
+    if base:
+        return Path(base) / "code-recap"
+    return Path.home() / ".cache" / "code-recap"
+
+
 def get_default_scan_root() -> Path:
     """Gets the default root directory for scanning repositories.
 
@@ -12,12 +12,14 @@ variables (OPENAI_API_KEY, ANTHROPIC_API_KEY, or GEMINI_API_KEY).
 
 import argparse
 import datetime as _dt
+import functools
 import os
 import re
 import sys
+import time
 from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, TextIO
 
 from code_recap.arguments import (
     add_author_arg,
@@ -217,6 +219,7 @@ class ClientConfig:
     clients: dict[str, ClientMatcher]
     default_client: Optional[str] = None
     global_context: str = ""
+    _categorize_cache: dict = field(default_factory=dict, repr=False, compare=False)
 
     def get_client_context(self, client_name: str) -> str:
         """Gets the context string for a client.
@@ -261,19 +264,27 @@ class ClientConfig:
     def categorize_repos(self, repos: list[str]) -> dict[str, list[str]]:
         """Groups repositories by client.
 
+        Memoized per instance: the same repo list is typically categorized
+        several times per run (client filtering, then per-stage grouping).
+
         Args:
             repos: List of repository paths.
 
         Returns:
-            Dict mapping client name to list of repo paths.
+            Dict mapping client name to list of repo paths. Treat the
+            returned dict as read-only; it is shared between callers.
         """
-        result: dict[str, list[str]] = {}
-        for repo in repos:
-            project_name = os.path.basename(repo)
-            client = self.categorize_project(project_name)
-            if client not in result:
-                result[client] = []
-            result[client].append(repo)
+        key = tuple(repos)
+        result = self._categorize_cache.get(key)
+        if result is None:
+            result = {}
+            for repo in repos:
+                project_name = os.path.basename(repo)
+                client = self.categorize_project(project_name)
+                if client not in result:
+                    result[client] = []
+                result[client].append(repo)
+            self._categorize_cache[key] = result
         return result
 
 
@@ -443,15 +454,29 @@ RECOMMENDED_MODELS = {
 }
 
 
+@functools.cache
+def _get_model_cost_table() -> Optional[dict]:
+    """Loads litellm's model cost table once per process.
+
+    Returns:
+        Mapping of model name to litellm cost metadata, or None if litellm
+        is not installed.
+    """
+    try:
+        import litellm  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+    return litellm.model_cost
+
+
 def list_available_models(provider: Optional[str] = None) -> None:
     """Lists available models, optionally filtered by provider.
 
     Args:
         provider: Optional provider filter ('openai', 'anthropic', 'gemini', or None for all).
     """
-    try:
-        import litellm  # pyright: ignore[reportMissingImports]
-    except ImportError:
+    model_cost = _get_model_cost_table()
+    if model_cost is None:
         print("litellm not installed. Install with: pip install litellm", file=sys.stderr)
         return
 
@@ -470,16 +495,12 @@ def list_available_models(provider: Optional[str] = None) -> None:
     for prov in providers_to_show:
         print(f"=== {prov.upper()} ===")
         for model, description in RECOMMENDED_MODELS[prov]:
-            # Try to get cost info from litellm
+            cost = model_cost.get(model)
             cost_info = ""
-            try:
-                if model in litellm.model_cost:
-                    cost = litellm.model_cost[model]
-                    input_cost = cost.get("input_cost_per_token", 0) * 1_000_000
-                    output_cost = cost.get("output_cost_per_token", 0) * 1_000_000
-                    cost_info = f" [${input_cost:.2f}/${output_cost:.2f} per 1M tokens]"
-            except Exception:
-                pass
+            if cost:
+                input_cost = (cost.get("input_cost_per_token") or 0) * 1_000_000
+                output_cost = (cost.get("output_cost_per_token") or 0) * 1_000_000
+                cost_info = f" [${input_cost:.2f}/${output_cost:.2f} per 1M tokens]"
             print(f"  {model:<45} {description}{cost_info}")
         print()
 
@@ -883,42 +904,185 @@ class CostTracker:
     Attributes:
         total_input_tokens: Total input tokens used.
         total_output_tokens: Total output tokens used.
+        total_cached_tokens: Input tokens served from the provider's prompt cache.
         total_cost: Total estimated cost in USD.
         calls: Number of API calls made.
     """
 
     total_input_tokens: int = 0
     total_output_tokens: int = 0
+    total_cached_tokens: int = 0
     total_cost: float = 0.0
     calls: int = 0
 
-    def add(self, input_tokens: int, output_tokens: int, cost: float) -> None:
+    def add(
+        self, input_tokens: int, output_tokens: int, cost: float, cached_tokens: int = 0
+    ) -> None:
         """Adds usage from a single API call.
 
         Args:
             input_tokens: Number of input tokens used.
             output_tokens: Number of output tokens generated.
             cost: Cost of this call in USD.
+            cached_tokens: Input tokens that hit the provider's prompt cache.
         """
         self.total_input_tokens += input_tokens
         self.total_output_tokens += output_tokens
+        self.total_cached_tokens += cached_tokens
         self.total_cost += cost
         self.calls += 1
 
+    def __iadd__(self, other: "CostTracker") -> "CostTracker":
+        """Accumulates another tracker's totals into this one.
+
+        Args:
+            other: Tracker whose totals to add (e.g. a per-stage tracker).
+
+        Returns:
+            This tracker, updated in place.
+        """
+        self.total_input_tokens += other.total_input_tokens
+        self.total_output_tokens += other.total_output_tokens
+        self.total_cached_tokens += other.total_cached_tokens
+        self.total_cost += other.total_cost
+        self.calls += other.calls
+        return self
+
     def summary(self) -> str:
         """Returns a formatted summary of costs.
 
         Returns:
             Human-readable cost summary string.
         """
+        cached = ""
+        if self.total_cached_tokens:
+            cached = f" ({format_number(self.total_cached_tokens)} cached)"
         return (
             f"API calls: {self.calls}, "
-            f"Input tokens: {format_number(self.total_input_tokens)}, "
+            f"Input tokens: {format_number(self.total_input_tokens)}{cached}, "
             f"Output tokens: {format_number(self.total_output_tokens)}, "
             f"Total cost: ${self.total_cost:.4f}"
         )
 
 
+# Retry policy for transient provider failures (rate limits, dropped
+# connections). Waits 1s, 2s, 4s... capped at 30s between attempts.
+_LLM_MAX_ATTEMPTS = 3
+
+
+def _transient_llm_errors() -> tuple:
+    """Returns the litellm exception types worth retrying.
+
+    Resolved lazily and defensively: the litellm exception surface has
+    shifted between versions, and the module must stay importable without
+    litellm installed.
+
+    Returns:
+        Tuple of exception classes (possibly empty).
+    """
+    try:
+        import litellm  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return ()
+    names = ("RateLimitError", "APIConnectionError", "ServiceUnavailableError", "Timeout")
+    return tuple(t for t in (getattr(litellm, n, None) for n in names) if isinstance(t, type))
+
+
+def _system_message(model: str, system_prompt: str) -> dict:
+    """Builds the system message, enabling provider prompt caching where needed.
+
+    Anthropic models require an explicit cache_control marker to reuse their
+    server-side prefix cache across calls that share a system prompt (the
+    research/write/review stages all resend the same multi-KB context block).
+    OpenAI's prefix cache is automatic, so plain string content suffices there.
+
+    Args:
+        model: LiteLLM model string.
+        system_prompt: System prompt text.
+
+    Returns:
+        A message dict for litellm's messages list.
+    """
+    model_name = model.lower()
+    if "claude" in model_name or "anthropic" in model_name:
+        return {
+            "role": "system",
+            "content": [
+                {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+            ],
+        }
+    return {"role": "system", "content": system_prompt}
+
+
+def _estimate_prompt_cost(model: str, messages: list) -> Optional[float]:
+    """Estimates the input cost of a completion call before making it.
+
+    Args:
+        model: LiteLLM model string.
+        messages: Messages list for the completion call.
+
+    Returns:
+        Estimated input cost in USD, or None if the model's pricing or
+        tokenizer is unknown.
+    """
+    try:
+        import litellm  # pyright: ignore[reportMissingImports]
+
+        cost = (_get_model_cost_table() or {}).get(model)
+        if not cost or not cost.get("input_cost_per_token"):
+            return None
+        tokens = litellm.token_counter(model=model, messages=messages)
+        return tokens * cost["input_cost_per_token"]
+    except Exception:
+        return None
+
+
+def _check_budget(estimate: Optional[float], cost_tracker: CostTracker, max_cost: float) -> None:
+    """Refuses a call whose estimated input cost would blow the budget.
+
+    Args:
+        estimate: Estimated input cost of the upcoming call, or None if
+            unknown (unknown estimates are allowed through).
+        cost_tracker: Tracker holding the spend so far.
+        max_cost: Maximum allowed total cost in USD.
+
+    Raises:
+        SystemExit: If the estimate would push total spend past max_cost.
+    """
+    if estimate is not None and cost_tracker.total_cost + estimate > max_cost:
+        raise SystemExit(
+            f"Estimated call cost ${estimate:.4f} would exceed budget (${max_cost:.2f}); "
+            f"spent ${cost_tracker.total_cost:.4f} so far."
+        )
+
+
+def _stream_completion(model: str, messages: list, temperature: float, output_stream: TextIO):
+    """Streams a completion, writing text deltas to `output_stream` as they arrive.
+
+    Args:
+        model: LiteLLM model string.
+        messages: Messages list for the completion call.
+        temperature: Sampling temperature.
+        output_stream: Open text stream that receives each content delta.
+
+    Returns:
+        The full response rebuilt from the stream chunks, so usage and cost
+        accounting match the non-streaming path.
+    """
+    import litellm  # pyright: ignore[reportMissingImports]
+
+    chunks = []
+    for chunk in litellm.completion(
+        model=model, messages=messages, temperature=temperature, stream=True
+    ):
+        chunks.append(chunk)
+        delta = getattr(chunk.choices[0].delta, "content", None) if chunk.choices else None
+        if delta:
+            output_stream.write(delta)
+    output_stream.flush()
+    return litellm.stream_chunk_builder(chunks, messages=messages)
+
+
 def call_llm(
     model: str,
     system_prompt: str,
@@ -926,6 +1090,7 @@ def call_llm(
     temperature: float,
     cost_tracker: CostTracker,
     max_cost: float,
+    output_stream: Optional[TextIO] = None,
 ) -> str:
     """Calls the LLM via LiteLLM and tracks costs.
 
@@ -936,6 +1101,9 @@ def call_llm(
         temperature: Sampling temperature.
         cost_tracker: CostTracker instance to update.
         max_cost: Maximum allowed total cost in USD.
+        output_stream: If provided, stream the response and write each text
+            delta to this stream as it arrives (the full text is still
+            returned).
 
     Returns:
         The LLM's response text.
@@ -954,26 +1122,61 @@ def call_llm(
             f"Budget limit reached (${max_cost:.2f}). Current spend: ${cost_tracker.total_cost:.4f}"
         )
 
-    response = completion(
-        model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        temperature=temperature,
-    )
+    messages = [
+        _system_message(model, system_prompt),
+        {"role": "user", "content": user_prompt},
+    ]
+    _check_budget(_estimate_prompt_cost(model, messages), cost_tracker, max_cost)
 
-    # Extract cost information from response
+    transient = _transient_llm_errors()
+    for attempt in range(_LLM_MAX_ATTEMPTS):
+        try:
+            if output_stream is not None:
+                response = _stream_completion(model, messages, temperature, output_stream)
+            else:
+                response = completion(model=model, messages=messages, temperature=temperature)
+            break
+        except transient as exc:
+            if attempt == _LLM_MAX_ATTEMPTS - 1:
+                raise
+            # Drop any partial streamed output before retrying
+            if output_stream is not None and output_stream.seekable():
+                output_stream.seek(0)
+                output_stream.truncate()
+            delay = min(2**attempt, 30)
+            print(
+                f"Transient LLM error ({type(exc).__name__}); retrying in {delay}s...",
+                file=sys.stderr,
+            )
+            time.sleep(delay)
+
+    _record_llm_usage(response, cost_tracker, max_cost)
+
+    return response.choices[0].message.content
+
+
+def _record_llm_usage(response, cost_tracker: CostTracker, max_cost: float) -> None:
+    """Records token usage and cost from an LLM response.
+
+    Args:
+        response: The litellm completion response.
+        cost_tracker: CostTracker instance to update.
+        max_cost: Maximum allowed total cost in USD (warn if exceeded).
+    """
     usage = response.usage
     input_tokens = usage.prompt_tokens if usage else 0
     output_tokens = usage.completion_tokens if usage else 0
 
+    # Prompt-cache hits, where the provider reports them (shape varies).
+    details = getattr(usage, "prompt_tokens_details", None) if usage else None
+    cached_tokens = getattr(details, "cached_tokens", 0) or 0
+
     # LiteLLM provides cost tracking
     cost = 0.0
     if hasattr(response, "_hidden_params"):
         cost = response._hidden_params.get("response_cost", 0.0) or 0.0
 
-    cost_tracker.add(input_tokens, output_tokens, cost)
+    cost_tracker.add(input_tokens, output_tokens, cost, cached_tokens)
 
     # Check if we've exceeded budget after this call
     if cost_tracker.total_cost > max_cost:
@@ -982,9 +1185,114 @@ def call_llm(
             file=sys.stderr,
         )
 
+
+async def acall_llm(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    cost_tracker: CostTracker,
+    max_cost: float,
+) -> str:
+    """Async variant of call_llm using litellm.acompletion.
+
+    Lets callers overlap several in-flight LLM requests on one event loop,
+    where the wall time is dominated by provider round trips. CostTracker
+    updates happen synchronously between awaits, so no extra locking is
+    needed for concurrent tasks in the same loop.
+
+    Args:
+        model: LiteLLM model string (e.g., 'gpt-4o-mini').
+        system_prompt: System prompt to set context.
+        user_prompt: User prompt with the actual request.
+        temperature: Sampling temperature.
+        cost_tracker: CostTracker instance to update.
+        max_cost: Maximum allowed total cost in USD.
+
+    Returns:
+        The LLM's response text.
+
+    Raises:
+        SystemExit: If max_cost would be exceeded.
+    """
+    try:
+        from litellm import acompletion  # pyright: ignore[reportMissingImports]
+    except ImportError as err:
+        raise SystemExit("litellm is required. Install with: pip install litellm") from err
+
+    if cost_tracker.total_cost >= max_cost:
+        raise SystemExit(
+            f"Budget limit reached (${max_cost:.2f}). Current spend: ${cost_tracker.total_cost:.4f}"
+        )
+
+    import asyncio
+
+    messages = [
+        _system_message(model, system_prompt),
+        {"role": "user", "content": user_prompt},
+    ]
+    _check_budget(_estimate_prompt_cost(model, messages), cost_tracker, max_cost)
+
+    transient = _transient_llm_errors()
+    for attempt in range(_LLM_MAX_ATTEMPTS):
+        try:
+            response = await acompletion(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+            )
+            break
+        except transient as exc:
+            if attempt == _LLM_MAX_ATTEMPTS - 1:
+                raise
+            delay = min(2**attempt, 30)
+            print(
+                f"Transient LLM error ({type(exc).__name__}); retrying in {delay}s...",
+                file=sys.stderr,
+            )
+            await asyncio.sleep(delay)
+
+    _record_llm_usage(response, cost_tracker, max_cost)
+
     return response.choices[0].message.content
 
 
+def call_llm_parallel(
+    model: str,
+    system_prompt: str,
+    user_prompts: Sequence[str],
+    temperature: float,
+    cost_tracker: CostTracker,
+    max_cost: float,
+) -> list[str]:
+    """Runs several LLM calls concurrently and returns responses in order.
+
+    Args:
+        model: LiteLLM model string.
+        system_prompt: System prompt shared by all calls.
+        user_prompts: User prompts, one per call.
+        temperature: Sampling temperature.
+        cost_tracker: CostTracker instance shared across all calls.
+        max_cost: Maximum allowed total cost in USD.
+
+    Returns:
+        List of response texts, in the same order as user_prompts.
+    """
+    import asyncio
+
+    async def _run() -> list[str]:
+        return list(
+            await asyncio.gather(
+                *(
+                    acall_llm(model, system_prompt, prompt, temperature, cost_tracker, max_cost)
+                    for prompt in user_prompts
+                )
+            )
+        )
+
+    return asyncio.run(_run())
+
+
 def gather_period_data(
     repos: list[str],
     start_date: _dt.date,
@@ -1562,7 +1870,7 @@ Environment variables for API keys:
         _, fetch_success = fetch_repos_with_progress(
             all_repos,
             include_submodules=True,
-            max_workers=8,
+            max_workers=args.fetch_jobs,
             error_on_failure=False,
             output=sys.stderr,
         )
@@ -1792,10 +2100,7 @@ Environment variables for API keys:
         print(f"Cost for {client_display}: {cost_tracker.summary()}", file=sys.stderr)
 
         # Add to total cost
-        total_cost_tracker.total_input_tokens += cost_tracker.total_input_tokens
-        total_cost_tracker.total_output_tokens += cost_tracker.total_output_tokens
-        total_cost_tracker.total_cost += cost_tracker.total_cost
-        total_cost_tracker.calls += cost_tracker.calls
+        total_cost_tracker += cost_tracker
 
         # Determine output directory and filenames
         if args.output and len(repos_by_client) == 1: